@@ -6,7 +6,7 @@ import copy
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class AppInfo:
     """Encapsulates application information for AppImage creation"""
 
@@ -42,6 +42,9 @@ from core.dependency_resolver import DependencyResolver, PrePackagingValidator
 from core.app_info import AppInfo
 from utils.i18n import _
 
+# App types that run on a bundled Python interpreter
+PYTHON_APP_TYPES = frozenset({"python", "python_wrapper", "gtk", "qt"})
+
 
 class AppImageBuilder:
     """Main class for building AppImages"""
@@ -71,7 +74,7 @@ class AppImageBuilder:
             return None
 
         app_type = self.app_info.app_type or "binary"
-        if app_type not in ["python", "python_wrapper", "gtk", "qt"]:
+        if app_type not in PYTHON_APP_TYPES:
             return None
 
         import platform
@@ -673,7 +676,7 @@ class AppImageBuilder:
                 app_info_for_apprun.python_version = self.python_version
 
             # Determine the components of the command that AppRun should execute
-            if app_type in ["python", "python_wrapper", "gtk", "qt"]:
+            if app_type in PYTHON_APP_TYPES:
                 structure = self.app_info.structure_analysis or {}
                 wrapper_analysis = structure.get("wrapper_analysis", {})
 
@@ -956,7 +959,7 @@ class AppImageBuilder:
 
         # Python dependencies (if Python app)
         app_type = self.app_info.app_type or "binary"
-        if app_type in ["python", "python_wrapper", "gtk", "qt"]:
+        if app_type in PYTHON_APP_TYPES:
             self._setup_python_environment()
 
         # External binaries with linuxdeploy
@@ -986,7 +989,7 @@ class AppImageBuilder:
         if include_icon_theme:
             # Check if it's a GTK application
             is_gtk_app = False
-            if app_type in ["python", "python_wrapper", "gtk", "qt"]:
+            if app_type in PYTHON_APP_TYPES:
                 is_gtk_app = self._detect_gi_usage(self.app_info)
 
             # If GTK app or user explicitly enabled, copy the selected theme
@@ -1735,7 +1738,7 @@ class AppImageBuilder:
 
             try:
                 # Validate based on app type
-                if app_type in ["python", "python_wrapper", "gtk", "qt"]:
+                if app_type in PYTHON_APP_TYPES:
                     # Validate Python
                     result = subprocess.run(
                         [
@@ -1840,12 +1843,7 @@ class AppImageBuilder:
                 raise RuntimeError(_("Build cancelled"))
 
             # Detect Python version from container
-            if self.app_info.app_type in [
-                "python",
-                "python_wrapper",
-                "gtk",
-                "qt",
-            ]:
+            if self.app_info.app_type in PYTHON_APP_TYPES:
                 py_cmd = [
                     "python3",
                     "-c",
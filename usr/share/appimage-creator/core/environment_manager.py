@@ -4,7 +4,7 @@ Manages build environments using Distrobox
 
 import subprocess
 import shutil
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Set
 
 from utils.system import (
     get_distro_info,
@@ -195,6 +195,11 @@ SUPPORTED_ENVIRONMENTS: List[Dict[str, Any]] = [
     # },
 ]
 
+# Environment specs keyed by id
+SUPPORTED_ENVIRONMENTS_BY_ID: Dict[str, Dict[str, Any]] = {
+    env["id"]: env for env in SUPPORTED_ENVIRONMENTS
+}
+
 
 class EnvironmentManager:
     """Handles detection, creation, and interaction with build environments."""
@@ -203,6 +208,11 @@ class EnvironmentManager:
         self.host_distro = get_distro_info()
         self.host_deps = check_host_dependencies(["podman", "docker", "distrobox"])
         self._distrobox_containers = self._list_distrobox_containers()
+        # get_supported_environments() result and the container list it was
+        # built from; any re-listing assigns a new set and so invalidates it
+        self._environments: List[Dict[str, Any]] = []
+        self._ready_environments: List[Dict[str, Any]] = []
+        self._environments_source: Optional[Set[str]] = None
 
     def check_container_runtime(self) -> Optional[str]:
         """Check which container runtime is installed (docker or podman)."""
@@ -322,8 +332,10 @@ class EnvironmentManager:
 
     def get_host_status(self) -> Dict[str, Any]:
         """Get a detailed status of the host environment."""
-        runtime = self.check_container_runtime()
+        # get_missing_components() already probes the runtime (which may run
+        # "docker ps"); reuse its answer instead of probing a second time
         missing = self.get_missing_components()
+        runtime = None if missing["runtime"] else missing["runtime_name"]
 
         return {
             "distro_id": self.host_distro.get("id", "Unknown"),
@@ -338,13 +350,23 @@ class EnvironmentManager:
         }
 
     def get_supported_environments(self) -> List[Dict[str, Any]]:
-        """Return the list of supported environments with their current status."""
+        """Return the list of supported environments with their current status.
+
+        The list is shared between callers until the container list is
+        refreshed, so it must not be modified.
+        """
+        # Read the container list once: worker threads may replace it while
+        # this runs, and the cache must be tagged with the list it came from
+        containers = self._distrobox_containers
+        if self._environments_source is containers:
+            return self._environments
+
         environments_with_status = []
         for env_spec in SUPPORTED_ENVIRONMENTS:
             env_info = env_spec.copy()
             container_name = self._get_container_name(env_spec["id"])
 
-            if container_name in self._distrobox_containers:
+            if container_name in containers:
                 # For now, we just check for existence. Later, we can check if deps are installed.
                 env_info["status"] = "ready"
             else:
@@ -353,8 +375,22 @@ class EnvironmentManager:
             env_info["container_name"] = container_name
             environments_with_status.append(env_info)
 
+        self._environments = environments_with_status
+        self._ready_environments = [
+            env for env in environments_with_status if env["status"] == "ready"
+        ]
+        self._environments_source = containers
         return environments_with_status
 
+    def get_ready_environments(self) -> List[Dict[str, Any]]:
+        """Return the supported environments whose container exists.
+
+        Cached together with get_supported_environments(); must not be
+        modified.
+        """
+        self.get_supported_environments()
+        return self._ready_environments
+
     def create_environment(
         self,
         env_id: str,
@@ -367,9 +403,7 @@ class EnvironmentManager:
                 _("Host is not set up for Distrobox (missing dependencies).")
             )
 
-        env_spec = next(
-            (env for env in SUPPORTED_ENVIRONMENTS if env["id"] == env_id), None
-        )
+        env_spec = SUPPORTED_ENVIRONMENTS_BY_ID.get(env_id)
         if not env_spec:
             raise ValueError(f"Environment ID '{env_id}' not found.")
 
@@ -530,9 +564,7 @@ class EnvironmentManager:
         if not self.is_host_ready():
             raise RuntimeError(_("Host is not set up for Distrobox."))
 
-        env_spec = next(
-            (env for env in SUPPORTED_ENVIRONMENTS if env["id"] == env_id), None
-        )
+        env_spec = SUPPORTED_ENVIRONMENTS_BY_ID.get(env_id)
         if not env_spec:
             raise ValueError(f"Environment ID '{env_id}' not found.")
 
@@ -638,9 +670,7 @@ class EnvironmentManager:
         if not self.is_host_ready():
             raise RuntimeError(_("Host is not set up for Distrobox."))
 
-        env_spec = next(
-            (env for env in SUPPORTED_ENVIRONMENTS if env["id"] == env_id), None
-        )
+        env_spec = SUPPORTED_ENVIRONMENTS_BY_ID.get(env_id)
         if not env_spec:
             raise ValueError(f"Environment ID '{env_id}' not found.")
 
@@ -725,10 +755,13 @@ class EnvironmentManager:
         """Generate a consistent container name for our app."""
         return f"appimage-creator-{env_id}"
 
-    def _list_distrobox_containers(self) -> List[str]:
-        """Get a list of existing distrobox containers by name."""
+    def _list_distrobox_containers(self) -> Set[str]:
+        """Get the names of the existing distrobox containers.
+
+        A set, since callers only test whether a container exists.
+        """
         if not self.host_deps.get("distrobox"):
-            return []
+            return set()
 
         try:
             result = subprocess.run(
@@ -739,15 +772,15 @@ class EnvironmentManager:
                 env=get_host_env(),
             )
             if result.returncode != 0:
-                return []
+                return set()
 
             # The output is a table with columns: ID | NAME | STATUS | IMAGE
             lines = result.stdout.strip().split("\n")
             if len(lines) < 2:
-                return []
+                return set()
 
             # Skip header line
-            container_names = []
+            container_names = set()
             for line in lines[1:]:
                 # Split by pipe separator
                 parts = [p.strip() for p in line.split("|")]
@@ -755,8 +788,8 @@ class EnvironmentManager:
                     # NAME is the second column (index 1)
                     name = parts[1].strip()
                     if name:
-                        container_names.append(name)
+                        container_names.add(name)
 
             return container_names
         except (subprocess.TimeoutExpired, FileNotFoundError):
-            return []
+            return set()
@@ -16,6 +16,8 @@ class SettingsManager:
         config_dir.mkdir(parents=True, exist_ok=True)
         self.settings_path = config_dir / "settings.json"
         self.settings: dict[str, Any] = {}
+        # Built once; get() falls back to it on every missing key
+        self._defaults = self._get_defaults()
         self._load()
 
     def _get_defaults(self) -> dict:
@@ -35,7 +37,7 @@ class SettingsManager:
                 self.settings = json.load(f)
         except (FileNotFoundError, json.JSONDecodeError):
             # If file doesn't exist or is corrupted, start with defaults
-            self.settings = self._get_defaults()
+            self.settings = dict(self._defaults)
             self._save()
 
     def _save(self):
@@ -48,10 +50,13 @@ class SettingsManager:
 
     def get(self, key: str) -> Any:
         """Gets a setting value by key, falling back to default if not found."""
-        return self.settings.get(key, self._get_defaults().get(key))
+        return self.settings.get(key, self._defaults.get(key))
 
     def set(self, key: str, value: Any) -> None:
         """Sets a setting value by key and saves the file."""
+        # Nothing to write if the stored value is already the same
+        if key in self.settings and self.settings[key] == value:
+            return
         self.settings[key] = value
         self._save()
 
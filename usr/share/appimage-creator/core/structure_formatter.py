@@ -1,18 +1,37 @@
 """Format detailed AppImage structure for display."""
 
 import os
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 from utils.file_ops import scan_directory_structure
 from utils.i18n import _
 from utils.system import format_size, sanitize_filename
 
+# Directory totals repeat across views (and often across directories)
+_format_size = lru_cache(maxsize=256)(format_size)
+
+
+def _basename(path: str) -> str:
+    """os.path.basename() for the plain path strings listed here"""
+    return path.rpartition(os.sep)[2]
+
+
+def _scan_or_error(directory: str) -> tuple[dict | None, Exception | None]:
+    """Scan ``directory``, returning (structure, None) or (None, error)"""
+    try:
+        return scan_directory_structure(directory), None
+    except Exception as e:
+        return None, e
+
 
 def generate_detailed_structure(
     app_name_raw: str,
     executable: str | None,
     structure_analysis: dict | None,
-    directories: list[str],
+    directories: Sequence[str],
     app_type: str,
 ) -> str:
     """Build a detailed text representation of the AppImage structure.
@@ -37,7 +56,7 @@ def generate_detailed_structure(
 
     if executable:
         lines.append(
-            f"            ├── {os.path.basename(executable)}"
+            f"            ├── {_basename(executable)}"
             " (main executable)"
         )
 
@@ -93,33 +112,35 @@ def generate_detailed_structure(
             items = det.get(key, [])
             if items:
                 lines += ["", f"            [{label}]"]
-                for f in items[:15]:
-                    suffix = "/" if key == "locale_dirs" else ""
-                    lines.append(f"            ├── {os.path.basename(f)}{suffix}")
+                suffix = "/" if key == "locale_dirs" else ""
+                lines.extend(
+                    f"            ├── {_basename(f)}{suffix}" for f in items[:15]
+                )
                 if len(items) > 15:
                     lines.append(f"            └── ... and {len(items) - 15} more")
 
     if directories:
         lines += ["", _("[Additional Directories]")]
-        for i, directory in enumerate(directories):
+        # The scans are I/O bound; run them side by side
+        with ThreadPoolExecutor(max_workers=min(8, len(directories))) as executor:
+            scans = list(executor.map(_scan_or_error, directories))
+        for i, (directory, (structure, error)) in enumerate(zip(directories, scans)):
             prefix = "└── " if i == len(directories) - 1 else "├── "
-            try:
-                structure = scan_directory_structure(directory)
-                fc = len(structure.get("files", []))
+            dn = _basename(directory)
+            if error is not None:
+                lines.append(f"{prefix}{dn}/ (error reading: {error})")
+            else:
+                files = structure.get("files", [])
+                fc = len(files)
                 ts = structure.get("total_size", 0)
-                dn = os.path.basename(directory)
-                lines.append(f"{prefix}{dn}/ ({fc} files, {format_size(ts)})")
-                for j, fi in enumerate(structure.get("files", [])[:10]):
-                    # Only the genuine last line (no "...more" line after) gets └──
-                    is_last = j == fc - 1
-                    fp = "    └── " if is_last else "    ├── "
-                    lines.append(f"{fp}{fi['name']}")
+                lines.append(f"{prefix}{dn}/ ({fc} files, {_format_size(ts)})")
+                # Only the genuine last line (no "...more" line after) gets └──
+                lines.extend(
+                    f"    {'└──' if j == fc - 1 else '├──'} {fi['path']}"
+                    for j, fi in enumerate(files[:10])
+                )
                 if fc > 10:
                     lines.append(f"    └── ... and {fc - 10} more files")
-            except Exception as e:
-                lines.append(
-                    f"{prefix}{os.path.basename(directory)}/ (error reading: {e})"
-                )
 
     lines += [
         "",
@@ -295,6 +295,17 @@ def get_template_for_type(app_type: str, app_info: AppInfo) -> AppTemplate:
     return template_class(app_info)
 
 
+# get_file_type() result -> application type, for files that are not wrappers
+_FILE_TYPE_TO_APP_TYPE = {
+    "python": "python",
+    "shell": "shell",
+    "java": "java",
+    "binary": "binary",
+    "javascript": "electron",
+    "unknown": "binary",
+}
+
+
 def get_app_type_from_file(
     file_path: str, structure_analysis: Optional[dict] = None
 ) -> str:
@@ -318,16 +329,7 @@ def get_app_type_from_file(
         # Add other wrapper types here if needed (e.g., java_wrapper)
 
     # Fallback to simple mapping
-    type_mapping = {
-        "python": "python",
-        "shell": "shell",
-        "java": "java",
-        "binary": "binary",
-        "javascript": "electron",
-        "unknown": "binary",
-    }
-
-    return type_mapping.get(file_type, "binary")
+    return _FILE_TYPE_TO_APP_TYPE.get(file_type, "binary")
 
 
 def get_available_categories() -> list[str]:
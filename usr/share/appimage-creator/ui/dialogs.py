@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+from collections import deque
 import gi
 
 gi.require_version("Gtk", "4.0")
@@ -15,6 +16,12 @@ from utils.i18n import _
 if TYPE_CHECKING:
     from core.settings import SettingsManager
 
+# os.waitstatus_to_exitcode() only exists on Python 3.9+; resolve it once
+_WAITSTATUS_TO_EXITCODE = getattr(os, "waitstatus_to_exitcode", None)
+
+# Gtk.FileFilter objects keyed by (name, patterns), shared by every chooser
+_FILE_FILTERS: dict[tuple[str, tuple[str, ...]], Gtk.FileFilter] = {}
+
 
 class BuildProgressDialog(Adw.Window):
     """Modal dialog showing build progress"""
@@ -205,15 +212,17 @@ class ValidationWarningDialog(Adw.Window):
             open_btn = Gtk.Button(label=_("Open Folder"))
             open_btn.add_css_class("pill")
             open_btn.add_css_class("suggested-action")
-            open_btn.connect("clicked", self._on_open_folder, appimage_path)
+            # Resolve the folder URI once; Gio percent-encodes the path
+            folder = os.path.dirname(appimage_path)
+            uri = Gio.File.new_for_path(folder).get_uri()
+            open_btn.connect("clicked", self._on_open_folder, folder, uri)
             btn_box.append(open_btn)
 
-    def _on_open_folder(self, _button, appimage_path: str):
-        folder = os.path.dirname(appimage_path)
+    def _on_open_folder(self, _button, folder: str, uri: str):
         try:
             launcher = Gio.AppInfo.get_default_for_type("inode/directory", True)
             if launcher:
-                launcher.launch_uris([f"file://{folder}"], None)
+                launcher.launch_uris([uri], None)
         except Exception:
             try:
                 subprocess.Popen(["xdg-open", folder])
@@ -411,6 +420,19 @@ def show_info_dialog(parent: Gtk.Window, title: str, message: str) -> None:
     dialog.present()
 
 
+def _file_filter(name: str, patterns: list[str]) -> Gtk.FileFilter:
+    """Return the file filter for ``patterns``, building it on first use"""
+    key = (name, tuple(patterns))
+    file_filter = _FILE_FILTERS.get(key)
+    if file_filter is None:
+        file_filter = Gtk.FileFilter()
+        file_filter.set_name(name)
+        for pattern in patterns:
+            file_filter.add_pattern(pattern)
+        _FILE_FILTERS[key] = file_filter
+    return file_filter
+
+
 def create_file_chooser(
     parent: Gtk.Window,
     title: str,
@@ -443,11 +465,7 @@ def create_file_chooser(
     # Add filters
     if filters:
         for filter_name, patterns in filters.items():
-            file_filter = Gtk.FileFilter()
-            file_filter.set_name(filter_name)
-            for pattern in patterns:
-                file_filter.add_pattern(pattern)
-            dialog.add_filter(file_filter)
+            dialog.add_filter(_file_filter(filter_name, patterns))
 
     def on_response_wrapper(dlg, response):
         # Save last used directory
@@ -537,6 +555,9 @@ def show_desktop_file_viewer(parent: Gtk.Window, desktop_file_path: str) -> None
 class LogProgressDialog(Adw.Window):
     """Modal dialog showing progress for a long-running task with live logs."""
 
+    # How often queued log lines are written to the terminal
+    LOG_FLUSH_INTERVAL_MS = 100
+
     def __init__(self, parent, title):
         super().__init__()
         self.set_transient_for(parent)
@@ -546,6 +567,13 @@ class LogProgressDialog(Adw.Window):
         self.set_resizable(True)
         self.set_deletable(False)
         self._cancelled = False
+        # Lines queued from worker threads, fed to the terminal in batches
+        self._pending_logs: deque[str] = deque()
+        self._flush_source = GLib.timeout_add(
+            self.LOG_FLUSH_INTERVAL_MS, self._flush_logs
+        )
+        # The dialog can go away before finish() is called
+        self.connect("destroy", lambda _win: self._stop_log_flush())
 
         main_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
         self.set_content(main_box)
@@ -614,12 +642,34 @@ class LogProgressDialog(Adw.Window):
         """Append a message to the terminal."""
         self.terminal.feed((message + "\r\n").encode("utf-8"))
 
+    def queue_log(self, message: str) -> None:
+        """Queue a message for the terminal; safe to call from any thread."""
+        self._pending_logs.append(message)
+
+    def _flush_logs(self) -> bool:
+        """Feed all queued messages to the terminal in a single write."""
+        lines = []
+        pending = self._pending_logs
+        while pending:
+            lines.append(pending.popleft())
+        if lines:
+            self.add_log("\r\n".join(lines))
+        return GLib.SOURCE_CONTINUE
+
+    def _stop_log_flush(self) -> None:
+        """Remove the periodic log flush, if it is still running."""
+        if self._flush_source:
+            GLib.source_remove(self._flush_source)
+            self._flush_source = 0
+
     def set_status(self, status_text: str) -> None:
         """Update the status label."""
         self.status_label.set_text(status_text)
 
     def finish(self, success: bool = True) -> None:
         """Mark the task as finished."""
+        self._stop_log_flush()
+        self._flush_logs()
         self.spinner.stop()
         self.cancel_button.set_visible(False)
         self.close_button.set_sensitive(True)
@@ -816,10 +866,9 @@ class InstallPackagesDialog(Adw.Window):
         else:
             # VTE reports a waitpid-style status; convert to a real exit code for display
             display_code = exit_status
-            _to_code = getattr(os, "waitstatus_to_exitcode", None)
-            if _to_code is not None:
+            if _WAITSTATUS_TO_EXITCODE is not None:
                 try:
-                    display_code = _to_code(exit_status)
+                    display_code = _WAITSTATUS_TO_EXITCODE(exit_status)
                 except (ValueError, OSError):
                     display_code = exit_status
             self._write_to_terminal(
@@ -18,13 +18,55 @@ from gi.repository import Gtk, Adw
 from pathlib import Path
 from typing import TYPE_CHECKING
 from templates.app_templates import get_available_categories
-from ui.widgets import DirectoryListWidget, DetectedFilesWidget
+from ui.widgets import DirectoryListWidget, DetectedFilesWidget, clear_list_box
 from utils.i18n import _
 
 if TYPE_CHECKING:
     from core.environment_manager import EnvironmentManager
 
 
+# Icon names and style classes shared by rows that are rebuilt on refresh
+ICON_OK = "emblem-ok-symbolic"
+ICON_WARNING = "dialog-warning-symbolic"
+ICON_ADD = "list-add-symbolic"
+ICON_DELETE = "edit-delete-symbolic"
+
+CSS_SUGGESTED = "suggested-action"
+CSS_DESTRUCTIVE = "destructive-action"
+CSS_BOXED_LIST = "boxed-list"
+CSS_FLAT = "flat"
+CSS_DIM_LABEL = "dim-label"
+CSS_ACCENT = "accent"
+
+
+# Application types and their labels, in the order of the app-type ComboRow
+APP_TYPES = (
+    "binary",
+    "python",
+    "python_wrapper",
+    "shell",
+    "java",
+    "qt",
+    "gtk",
+    "electron",
+)
+APP_TYPE_INDEX = {app_type: i for i, app_type in enumerate(APP_TYPES)}
+_APP_TYPE_LABELS = (
+    _("Binary"),
+    _("Python"),
+    _("Python Wrapper"),
+    _("Shell Script"),
+    _("Java"),
+    _("Qt"),
+    _("GTK"),
+    _("Electron"),
+)
+
+# Immutable ComboRow models, built on first use and shared by every page
+_APP_TYPE_MODEL: Gtk.StringList | None = None
+_CATEGORY_MODEL: Gtk.StringList | None = None
+
+
 # ---------------------------------------------------------------------------
 #  Helpers
 # ---------------------------------------------------------------------------
@@ -51,6 +93,22 @@ def _scrollable_content(spacing: int = 24) -> tuple[Gtk.ScrolledWindow, Gtk.Box]
     return scrolled, content_box
 
 
+def _app_type_model() -> Gtk.StringList:
+    """Return the shared application-type model."""
+    global _APP_TYPE_MODEL
+    if _APP_TYPE_MODEL is None:
+        _APP_TYPE_MODEL = Gtk.StringList.new(list(_APP_TYPE_LABELS))
+    return _APP_TYPE_MODEL
+
+
+def _category_model() -> Gtk.StringList:
+    """Return the shared desktop-category model."""
+    global _CATEGORY_MODEL
+    if _CATEGORY_MODEL is None:
+        _CATEGORY_MODEL = Gtk.StringList.new(get_available_categories())
+    return _CATEGORY_MODEL
+
+
 def _make_nav_page(
     title: str, tag: str
 ) -> tuple[Adw.NavigationPage, Adw.ToolbarView, Adw.HeaderBar]:
@@ -63,6 +121,16 @@ def _make_nav_page(
     return nav_page, toolbar_view, header
 
 
+def _make_button_row(
+    button_label: str, **row_props
+) -> tuple[Adw.ActionRow, Gtk.Button]:
+    """Create an ActionRow with a vertically centred button as its suffix."""
+    row = Adw.ActionRow(**row_props)
+    button = Gtk.Button(label=button_label, valign=Gtk.Align.CENTER)
+    row.add_suffix(button)
+    return row, button
+
+
 # ---------------------------------------------------------------------------
 #  Page 1 – Welcome
 # ---------------------------------------------------------------------------
@@ -99,7 +167,7 @@ class WelcomePage:
         desc_label = Gtk.Label(
             label=_("Create distributable AppImages from any Linux application")
         )
-        desc_label.add_css_class("dim-label")
+        desc_label.add_css_class(CSS_DIM_LABEL)
         desc_label.set_wrap(True)
         desc_label.set_justify(Gtk.Justification.CENTER)
         brand_box.append(desc_label)
@@ -107,37 +175,33 @@ class WelcomePage:
         content_box.append(brand_box)
 
         # ---- System Requirements ----
-        self.req_group = Adw.PreferencesGroup()
-        self.req_group.set_title(_("System Requirements"))
+        self.req_group = Adw.PreferencesGroup(title=_("System Requirements"))
 
         # Single-line rows: the status shows as a compact suffix label
         # instead of a subtitle, so each requirement takes one line and the
         # section stays short (no scrollbar on the main page).
-        self.distrobox_row = Adw.ActionRow()
-        self.distrobox_row.set_title("Distrobox")
+        self.distrobox_row = Adw.ActionRow(title="Distrobox")
         self.req_group.add(self.distrobox_row)
 
-        self.runtime_row = Adw.ActionRow()
-        self.runtime_row.set_title(_("Container Runtime"))
+        self.runtime_row = Adw.ActionRow(title=_("Container Runtime"))
         self.req_group.add(self.runtime_row)
 
-        self.fuse_row = Adw.ActionRow()
-        self.fuse_row.set_title("FUSE")
+        self.fuse_row = Adw.ActionRow(title="FUSE")
         self.req_group.add(self.fuse_row)
 
         content_box.append(self.req_group)
 
         # ---- Build Environments (collapsible) ----
-        self.env_group = Adw.PreferencesGroup()
-        self.env_group.set_title(_("Build Environments"))
-        self.env_group.set_description(
-            _("Manage containers for cross-distribution builds")
+        self.env_group = Adw.PreferencesGroup(
+            title=_("Build Environments"),
+            description=_("Manage containers for cross-distribution builds"),
         )
 
-        self.env_expander = Adw.ExpanderRow()
-        self.env_expander.set_title(_("Available Containers"))
-        self.env_expander.set_subtitle(_("Click to manage build containers"))
-        self.env_expander.set_show_enable_switch(False)
+        self.env_expander = Adw.ExpanderRow(
+            title=_("Available Containers"),
+            subtitle=_("Click to manage build containers"),
+            show_enable_switch=False,
+        )
         self.env_group.add(self.env_expander)
 
         content_box.append(self.env_group)
@@ -145,20 +209,23 @@ class WelcomePage:
         # Callbacks set by window.py
         self.on_setup_clicked_callback = None
         self.on_remove_clicked_callback = None
+        self.on_install_clicked_callback = None
 
         # Track env rows for proper cleanup
         self._env_rows: list[Adw.ActionRow] = []
+        # (id, status) pairs the rows were last built from
+        self._env_signature: tuple | None = None
 
         # ---- Continue ----
         continue_group = Adw.PreferencesGroup()
         continue_group.set_margin_top(8)
 
-        continue_row = Adw.ActionRow()
-        continue_row.set_title(_("Continue"))
-        continue_row.set_subtitle(_("Configure your AppImage"))
+        continue_row = Adw.ActionRow(
+            title=_("Continue"), subtitle=_("Configure your AppImage")
+        )
 
         self.continue_button = Gtk.Button(label=_("Continue"))
-        self.continue_button.add_css_class("suggested-action")
+        self.continue_button.add_css_class(CSS_SUGGESTED)
         self.continue_button.set_valign(Gtk.Align.CENTER)
         continue_row.add_suffix(self.continue_button)
         continue_row.set_activatable_widget(self.continue_button)
@@ -213,12 +280,12 @@ class WelcomePage:
         if not host["is_ready"]:
             if self._install_row is None:
                 self.install_button = Gtk.Button(label=_("Install Required Packages"))
-                self.install_button.add_css_class("suggested-action")
+                self.install_button.add_css_class(CSS_SUGGESTED)
                 self.install_button.set_valign(Gtk.Align.CENTER)
-                self._install_row = Adw.ActionRow()
-                self._install_row.set_title(_("Missing Components"))
-                self._install_row.set_subtitle(
-                    _("Install required packages to enable container builds")
+                self.install_button.connect("clicked", self._on_install_button_clicked)
+                self._install_row = Adw.ActionRow(
+                    title=_("Missing Components"),
+                    subtitle=_("Install required packages to enable container builds"),
                 )
                 self._install_row.add_suffix(self.install_button)
                 self.req_group.add(self._install_row)
@@ -228,6 +295,10 @@ class WelcomePage:
                 self._install_row = None
                 self.install_button = None
 
+    def _on_install_button_clicked(self, _button):
+        if self.on_install_clicked_callback:
+            self.on_install_clicked_callback()
+
     @staticmethod
     def _set_row_status(
         row: Adw.ActionRow, ok: bool, text: str, tooltip: str | None = None
@@ -242,7 +313,7 @@ class WelcomePage:
         old_icon = getattr(row, "_status_icon", None)
         if old_icon is not None:
             row.remove(old_icon)
-        icon_name = "emblem-ok-symbolic" if ok else "dialog-warning-symbolic"
+        icon_name = ICON_OK if ok else ICON_WARNING
         icon = Gtk.Image.new_from_icon_name(icon_name)
         row.add_prefix(icon)
         row._status_icon = icon  # type: ignore[attr-defined]
@@ -251,9 +322,8 @@ class WelcomePage:
         old_label = getattr(row, "_status_label", None)
         if old_label is not None:
             row.remove(old_label)
-        label = Gtk.Label(label=text)
-        label.set_valign(Gtk.Align.CENTER)
-        label.add_css_class("dim-label")
+        label = Gtk.Label(label=text, valign=Gtk.Align.CENTER)
+        label.add_css_class(CSS_DIM_LABEL)
         row.add_suffix(label)
         row._status_label = label  # type: ignore[attr-defined]
 
@@ -261,71 +331,81 @@ class WelcomePage:
 
     def update_environments(self, env_manager: EnvironmentManager) -> None:
         """Populate the Build Environments expander with available containers."""
-        # Clear previously tracked rows
-        for old_row in self._env_rows:
-            self.env_expander.remove(old_row)
-        self._env_rows = []
-
-        ready_count = 0
-        for env in env_manager.get_supported_environments():
-            row = Adw.ActionRow()
-            row.set_title(env["name"])
-            desc = env["description"]
+        environments = env_manager.get_supported_environments()
 
-            # Show "★ Recommended" badge on recommended environments
-            is_recommended = _("Recommended") in desc
-            if is_recommended:
-                # Strip "Recommended - " prefix from subtitle
-                desc = desc.replace(_("Recommended") + " - ", "")
-                badge = Gtk.Label(label=_("★ Recommended"))
-                badge.add_css_class("accent")
-                badge.set_valign(Gtk.Align.CENTER)
-                row.add_suffix(badge)
+        # Nothing to do when no container changed status since the last call
+        signature = tuple((env["id"], env["status"]) for env in environments)
+        if signature == self._env_signature:
+            return
+        self._env_signature = signature
+
+        # Hold back the expander's property notifications until all rows
+        # are in place, so listeners see one update instead of one per row.
+        self.env_expander.freeze_notify()
+        try:
+            # Clear previously tracked rows
+            for old_row in self._env_rows:
+                self.env_expander.remove(old_row)
+            self._env_rows = []
+
+            ready_count = 0
+            for env in environments:
+                row = Adw.ActionRow(title=env["name"])
+                desc = env["description"]
+
+                # Show "★ Recommended" badge on recommended environments
+                is_recommended = _("Recommended") in desc
+                if is_recommended:
+                    # Strip "Recommended - " prefix from subtitle
+                    desc = desc.replace(_("Recommended") + " - ", "")
+                    badge = Gtk.Label(label=_("★ Recommended"))
+                    badge.add_css_class(CSS_ACCENT)
+                    badge.set_valign(Gtk.Align.CENTER)
+                    row.add_suffix(badge)
+
+                row.set_subtitle(desc)
+
+                if env["status"] == "ready":
+                    ready_count += 1
+                    icon = Gtk.Image.new_from_icon_name(ICON_OK)
+                    row.add_prefix(icon)
+
+                    remove_btn = Gtk.Button(
+                        label=_("Remove"),
+                        valign=Gtk.Align.CENTER,
+                        css_classes=[CSS_DESTRUCTIVE],
+                    )
+                    remove_btn.env_id = env["id"]  # type: ignore[attr-defined]
+                    remove_btn.connect("clicked", self._on_remove_button_clicked)
+                    row.add_suffix(remove_btn)
+                else:
+                    icon = Gtk.Image.new_from_icon_name(ICON_ADD)
+                    row.add_prefix(icon)
+
+                    setup_btn = Gtk.Button(label=_("Setup"), valign=Gtk.Align.CENTER)
+                    setup_btn.add_css_class(CSS_SUGGESTED)
+                    setup_btn.env_id = env["id"]  # type: ignore[attr-defined]
+                    setup_btn.connect("clicked", self._on_setup_button_clicked)
+                    row.add_suffix(setup_btn)
+
+                self.env_expander.add_row(row)
+                self._env_rows.append(row)
+
+            # Update subtitle with count
+            total = len(environments)
+            self.env_expander.set_subtitle(
+                _("{} of {} containers ready").format(ready_count, total)
+            )
+        finally:
+            self.env_expander.thaw_notify()
 
-            row.set_subtitle(desc)
+    def _on_setup_button_clicked(self, button: Gtk.Button) -> None:
+        if self.on_setup_clicked_callback:
+            self.on_setup_clicked_callback(button.env_id)
 
-            if env["status"] == "ready":
-                ready_count += 1
-                icon = Gtk.Image.new_from_icon_name("emblem-ok-symbolic")
-                row.add_prefix(icon)
-
-                remove_btn = Gtk.Button(label=_("Remove"))
-                remove_btn.set_valign(Gtk.Align.CENTER)
-                remove_btn.add_css_class("destructive-action")
-                remove_btn.connect(
-                    "clicked",
-                    lambda _b, eid=env["id"]: (
-                        self.on_remove_clicked_callback(eid)
-                        if self.on_remove_clicked_callback
-                        else None
-                    ),
-                )
-                row.add_suffix(remove_btn)
-            else:
-                icon = Gtk.Image.new_from_icon_name("list-add-symbolic")
-                row.add_prefix(icon)
-
-                setup_btn = Gtk.Button(label=_("Setup"))
-                setup_btn.set_valign(Gtk.Align.CENTER)
-                setup_btn.add_css_class("suggested-action")
-                setup_btn.connect(
-                    "clicked",
-                    lambda _b, eid=env["id"]: (
-                        self.on_setup_clicked_callback(eid)
-                        if self.on_setup_clicked_callback
-                        else None
-                    ),
-                )
-                row.add_suffix(setup_btn)
-
-            self.env_expander.add_row(row)
-            self._env_rows.append(row)
-
-        # Update subtitle with count
-        total = len(env_manager.get_supported_environments())
-        self.env_expander.set_subtitle(
-            _("{} of {} containers ready").format(ready_count, total)
-        )
+    def _on_remove_button_clicked(self, button: Gtk.Button) -> None:
+        if self.on_remove_clicked_callback:
+            self.on_remove_clicked_callback(button.env_id)
 
 
 # ---------------------------------------------------------------------------
@@ -345,72 +425,48 @@ class ApplicationPage:
         toolbar_view.set_content(scrolled)
 
         # ---- Application Setup ----
-        setup_group = Adw.PreferencesGroup()
-        setup_group.set_title(_("Application Setup"))
-        setup_group.set_description(
-            _("Define the essential information for your AppImage")
+        setup_group = Adw.PreferencesGroup(
+            title=_("Application Setup"),
+            description=_("Define the essential information for your AppImage"),
         )
 
         # Executable
-        self.executable_row = Adw.ActionRow()
-        self.executable_row.set_title(_("Main Executable"))
-        self.executable_row.set_subtitle(_("Select the main application file"))
-        self.executable_row.set_icon_name("application-x-executable-symbolic")
-
-        self.executable_button = Gtk.Button(label=_("Choose File"))
-        self.executable_button.set_valign(Gtk.Align.CENTER)
-        self.executable_row.add_suffix(self.executable_button)
+        self.executable_row, self.executable_button = _make_button_row(
+            _("Choose File"),
+            title=_("Main Executable"),
+            subtitle=_("Select the main application file"),
+            icon_name="application-x-executable-symbolic",
+        )
         setup_group.add(self.executable_row)
 
         # App name
-        self.name_row = Adw.EntryRow()
-        self.name_row.set_title(_("Application Name"))
+        self.name_row = Adw.EntryRow(title=_("Application Name"))
         setup_group.add(self.name_row)
 
         # Icon
-        self.icon_row = Adw.ActionRow()
-        self.icon_row.set_title(_("Application Icon"))
-        self.icon_row.set_subtitle(
-            _("Recommended – needed for menu and taskbar integration")
+        self.icon_row, self.icon_button = _make_button_row(
+            _("Choose Icon"),
+            title=_("Application Icon"),
+            subtitle=_("Recommended – needed for menu and taskbar integration"),
+            icon_name="image-x-generic-symbolic",
         )
-        self.icon_row.set_icon_name("image-x-generic-symbolic")
-
-        self.icon_button = Gtk.Button(label=_("Choose Icon"))
-        self.icon_button.set_valign(Gtk.Align.CENTER)
-        self.icon_row.add_suffix(self.icon_button)
         setup_group.add(self.icon_row)
 
         # Desktop file
-        self.desktop_row = Adw.ActionRow()
-        self.desktop_row.set_title(_("Desktop File"))
-        self.desktop_row.set_subtitle(
-            _("Optional – a default will be generated if not provided")
+        self.desktop_row, self.desktop_button = _make_button_row(
+            _("Choose File"),
+            title=_("Desktop File"),
+            subtitle=_("Optional – a default will be generated if not provided"),
+            icon_name="application-x-desktop-symbolic",
         )
-        self.desktop_row.set_icon_name("application-x-desktop-symbolic")
-
-        self.desktop_button = Gtk.Button(label=_("Choose File"))
-        self.desktop_button.set_valign(Gtk.Align.CENTER)
-        self.desktop_row.add_suffix(self.desktop_button)
         setup_group.add(self.desktop_row)
 
         # App type (auto-detected)
-        self.app_type_row = Adw.ComboRow()
-        self.app_type_row.set_title(_("Application Type"))
-        self.app_type_row.set_subtitle(_("Auto-detected from executable"))
-
-        type_model = Gtk.StringList()
-        for label in [
-            _("Binary"),
-            _("Python"),
-            _("Python Wrapper"),
-            _("Shell Script"),
-            _("Java"),
-            _("Qt"),
-            _("GTK"),
-            _("Electron"),
-        ]:
-            type_model.append(label)
-        self.app_type_row.set_model(type_model)
+        self.app_type_row = Adw.ComboRow(
+            title=_("Application Type"), subtitle=_("Auto-detected from executable")
+        )
+
+        self.app_type_row.set_model(_app_type_model())
         self.app_type_row.set_selected(0)
         setup_group.add(self.app_type_row)
 
@@ -419,9 +475,9 @@ class ApplicationPage:
         # ---- Status ----
         self.status_group = Adw.PreferencesGroup()
 
-        self.status_row = Adw.ActionRow()
-        self.status_row.set_title(_("Getting Started"))
-        self.status_row.set_subtitle(_("Enter name and select executable"))
+        self.status_row = Adw.ActionRow(
+            title=_("Getting Started"), subtitle=_("Enter name and select executable")
+        )
 
         self._status_icon = Gtk.Image.new_from_icon_name("dialog-information-symbolic")
         self.status_row.add_prefix(self._status_icon)
@@ -434,12 +490,12 @@ class ApplicationPage:
         continue_group = Adw.PreferencesGroup()
         continue_group.set_margin_top(8)
 
-        continue_row = Adw.ActionRow()
-        continue_row.set_title(_("Continue"))
-        continue_row.set_subtitle(_("Configure files and details"))
+        continue_row = Adw.ActionRow(
+            title=_("Continue"), subtitle=_("Configure files and details")
+        )
 
         self.continue_button = Gtk.Button(label=_("Continue"))
-        self.continue_button.add_css_class("suggested-action")
+        self.continue_button.add_css_class(CSS_SUGGESTED)
         self.continue_button.set_valign(Gtk.Align.CENTER)
         self.continue_button.set_sensitive(False)
         continue_row.add_suffix(self.continue_button)
@@ -466,25 +522,18 @@ class ConfigurationPage:
         toolbar_view.set_content(scrolled)
 
         # ---- App Details ----
-        details_group = Adw.PreferencesGroup()
-        details_group.set_title(_("Application Details"))
+        details_group = Adw.PreferencesGroup(title=_("Application Details"))
 
-        self.version_row = Adw.EntryRow()
-        self.version_row.set_title(_("Version"))
+        self.version_row = Adw.EntryRow(title=_("Version"))
         self.version_row.set_text("1.0.0")
         details_group.add(self.version_row)
 
-        self.description_row = Adw.EntryRow()
-        self.description_row.set_title(_("Description"))
+        self.description_row = Adw.EntryRow(title=_("Description"))
         details_group.add(self.description_row)
 
-        self.category_row = Adw.ComboRow()
-        self.category_row.set_title(_("Primary Category"))
+        self.category_row = Adw.ComboRow(title=_("Primary Category"))
         categories = get_available_categories()
-        cat_model = Gtk.StringList()
-        for cat in categories:
-            cat_model.append(cat)
-        self.category_row.set_model(cat_model)
+        self.category_row.set_model(_category_model())
         # Default to "Utility" by name so it stays correct if the list changes
         default_category = "Utility"
         default_index = (
@@ -495,34 +544,33 @@ class ConfigurationPage:
         self.category_row.set_selected(default_index)
         details_group.add(self.category_row)
 
-        self.terminal_row = Adw.SwitchRow()
-        self.terminal_row.set_title(_("Requires Terminal"))
-        self.terminal_row.set_subtitle(
-            _("Check if your application needs to run in a terminal")
+        self.terminal_row = Adw.SwitchRow(
+            title=_("Requires Terminal"),
+            subtitle=_("Check if your application needs to run in a terminal"),
         )
         details_group.add(self.terminal_row)
 
         content_box.append(details_group)
 
         # ---- Files & Resources ----
-        files_group = Adw.PreferencesGroup()
-        files_group.set_title(_("Additional Directories"))
-        files_group.set_description(
-            _("Include extra directories like locale files, plugins, or data")
+        files_group = Adw.PreferencesGroup(
+            title=_("Additional Directories"),
+            description=_(
+                "Include extra directories like locale files, plugins, or data"
+            ),
         )
 
-        add_dir_row = Adw.ActionRow()
-        add_dir_row.set_title(_("Add Directory"))
-        add_dir_row.set_subtitle(_("Include additional files and directories"))
-
-        self.add_dir_button = Gtk.Button(label=_("Add Directory"))
-        self.add_dir_button.set_valign(Gtk.Align.CENTER)
-        add_dir_row.add_suffix(self.add_dir_button)
+        add_dir_row, self.add_dir_button = _make_button_row(
+            _("Add Directory"),
+            title=_("Add Directory"),
+            subtitle=_("Include additional files and directories"),
+        )
         files_group.add(add_dir_row)
 
-        self.additional_dirs_listbox = Gtk.ListBox()
-        self.additional_dirs_listbox.set_selection_mode(Gtk.SelectionMode.NONE)
-        self.additional_dirs_listbox.add_css_class("boxed-list")
+        self.additional_dirs_listbox = Gtk.ListBox(
+            selection_mode=Gtk.SelectionMode.NONE
+        )
+        self.additional_dirs_listbox.add_css_class(CSS_BOXED_LIST)
         files_group.add(self.additional_dirs_listbox)
 
         self.directory_list = DirectoryListWidget(self.additional_dirs_listbox)
@@ -530,16 +578,14 @@ class ConfigurationPage:
         content_box.append(files_group)
 
         # ---- Auto-detected Files ----
-        self.detected_group = Adw.PreferencesGroup()
-        self.detected_group.set_title(_("Auto-detected Files"))
-        self.detected_group.set_description(
-            _("Files automatically found for your application")
+        self.detected_group = Adw.PreferencesGroup(
+            title=_("Auto-detected Files"),
+            description=_("Files automatically found for your application"),
         )
         self.detected_group.set_visible(False)
 
-        self.detected_listbox = Gtk.ListBox()
-        self.detected_listbox.set_selection_mode(Gtk.SelectionMode.NONE)
-        self.detected_listbox.add_css_class("boxed-list")
+        self.detected_listbox = Gtk.ListBox(selection_mode=Gtk.SelectionMode.NONE)
+        self.detected_listbox.add_css_class(CSS_BOXED_LIST)
         self.detected_group.add(self.detected_listbox)
 
         self.detected_files = DetectedFilesWidget(self.detected_listbox)
@@ -547,56 +593,50 @@ class ConfigurationPage:
         content_box.append(self.detected_group)
 
         # ---- Desktop File ----
-        self.desktop_file_group = Adw.PreferencesGroup()
-        self.desktop_file_group.set_title(_("Desktop File"))
+        self.desktop_file_group = Adw.PreferencesGroup(title=_("Desktop File"))
         self.desktop_file_group.set_visible(False)
 
-        self.use_existing_desktop_row = Adw.SwitchRow()
-        self.use_existing_desktop_row.set_title(_("Use Existing Desktop File"))
-        self.use_existing_desktop_row.set_subtitle(
-            _("Found desktop file in application")
+        self.use_existing_desktop_row = Adw.SwitchRow(
+            title=_("Use Existing Desktop File"),
+            subtitle=_("Found desktop file in application"),
         )
         self.use_existing_desktop_row.set_active(True)
         self.desktop_file_group.add(self.use_existing_desktop_row)
 
-        self.found_desktop_row = Adw.ActionRow()
-        self.found_desktop_row.set_title(_("Detected Desktop File"))
-        self.found_desktop_row.set_subtitle(_("No desktop file detected"))
-
-        self.view_desktop_button = Gtk.Button(label=_("View"))
-        self.view_desktop_button.set_valign(Gtk.Align.CENTER)
-        self.found_desktop_row.add_suffix(self.view_desktop_button)
+        self.found_desktop_row, self.view_desktop_button = _make_button_row(
+            _("View"),
+            title=_("Detected Desktop File"),
+            subtitle=_("No desktop file detected"),
+        )
         self.desktop_file_group.add(self.found_desktop_row)
 
-        self.manual_desktop_row = Adw.ActionRow()
-        self.manual_desktop_row.set_title(_("Custom Desktop File"))
-        self.manual_desktop_row.set_subtitle(_("Or select a different .desktop file"))
-
-        self.choose_desktop_button = Gtk.Button(label=_("Choose File"))
-        self.choose_desktop_button.set_valign(Gtk.Align.CENTER)
-        self.manual_desktop_row.add_suffix(self.choose_desktop_button)
+        self.manual_desktop_row, self.choose_desktop_button = _make_button_row(
+            _("Choose File"),
+            title=_("Custom Desktop File"),
+            subtitle=_("Or select a different .desktop file"),
+        )
         self.desktop_file_group.add(self.manual_desktop_row)
 
         content_box.append(self.desktop_file_group)
 
         # ---- Structure Preview ----
-        self.preview_group = Adw.PreferencesGroup()
-        self.preview_group.set_title(_("Structure Preview"))
-        self.preview_group.set_description(
-            _("View the complete structure that will be included in the AppImage")
+        self.preview_group = Adw.PreferencesGroup(
+            title=_("Structure Preview"),
+            description=_(
+                "View the complete structure that will be included in the AppImage"
+            ),
         )
         self.preview_group.set_visible(False)
 
-        preview_row = Adw.ActionRow()
-        preview_row.set_title(_("AppImage Structure"))
-        preview_row.set_subtitle(
-            _("View all files and directories that will be packaged")
+        preview_row, self.full_structure_button = _make_button_row(
+            _("View Full Structure"),
+            title=_("AppImage Structure"),
+            subtitle=_("View all files and directories that will be packaged"),
         )
-
-        self.full_structure_button = Gtk.Button(label=_("View Full Structure"))
-        self.full_structure_button.set_valign(Gtk.Align.CENTER)
-        self.full_structure_button.add_css_class("suggested-action")
-        preview_row.add_suffix(self.full_structure_button)
+        self.full_structure_button.add_css_class(CSS_SUGGESTED)
+        # Shown while the full structure is being generated in the background
+        self.structure_spinner = Gtk.Spinner(visible=False)
+        preview_row.add_suffix(self.structure_spinner)
         self.preview_group.add(preview_row)
 
         self.preview_text = None  # kept for compatibility
@@ -604,83 +644,55 @@ class ConfigurationPage:
         content_box.append(self.preview_group)
 
         # ---- Auto-Update (Optional) ----
-        update_group = Adw.PreferencesGroup()
-        update_group.set_title(_("Auto-Update (Optional)"))
-        update_group.set_description(
-            _("Enable automatic update checking for this AppImage")
+        update_group = Adw.PreferencesGroup(
+            title=_("Auto-Update (Optional)"),
+            description=_("Enable automatic update checking for this AppImage"),
         )
 
         # Help expander
-        help_expander = Adw.ExpanderRow()
-        help_expander.set_title(_("How to configure auto-updates"))
-        help_expander.set_subtitle(_("Click to see examples"))
-
-        help_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
-        help_box.set_margin_start(12)
-        help_box.set_margin_end(12)
-        help_box.set_margin_top(6)
-        help_box.set_margin_bottom(6)
-
-        help_text = Gtk.Label()
-        help_text.set_markup(
-            _(
-                "<b>GitHub Releases (recommended):</b>\n"
-                "Click the button next to Update URL to fill with template,"
-                " then edit OWNER/REPO\n\n"
-                "<b>Example:</b>\n"
-                "https://api.github.com/repos/biglinux/"
-                "big-video-converter/releases/latest\n\n"
-                "<b>Filename Pattern:</b>\n"
-                "Used to identify which file to download from the release.\n"
-                "The asterisk (*) matches any text.\n\n"
-                "<b>Pattern Examples:</b>\n"
-                "• myapp-*-x86_64.AppImage  → matches: "
-                "myapp-v1.2.3-x86_64.AppImage\n"
-                "• *-gui-*.AppImage  → matches: converter-gui-1.0.AppImage\n"
-                "• calculator-*.AppImage  → matches: "
-                "calculator-2.5-linux.AppImage"
-            )
+        help_expander = Adw.ExpanderRow(
+            title=_("How to configure auto-updates"),
+            subtitle=_("Click to see examples"),
         )
-        help_text.set_wrap(True)
-        help_text.set_xalign(0)
-        help_box.append(help_text)
 
-        help_expander.add_row(help_box)
+        # The examples are built the first time the row is expanded
+        self._help_expanded_handler = help_expander.connect(
+            "notify::expanded", self._on_help_first_expanded
+        )
         update_group.add(help_expander)
 
         # Update URL
-        self.update_url_row = Adw.EntryRow()
-        self.update_url_row.set_title(_("Update URL"))
-        self.update_url_row.set_text("")
-
-        template_btn = Gtk.Button()
-        template_btn.set_icon_name("edit-paste-symbolic")
-        template_btn.set_valign(Gtk.Align.CENTER)
-        template_btn.set_tooltip_text(_("Paste GitHub API template"))
-        template_btn.add_css_class("flat")
+        self.update_url_row = Adw.EntryRow(title=_("Update URL"))
+
+        template_btn = Gtk.Button(
+            icon_name="edit-paste-symbolic",
+            valign=Gtk.Align.CENTER,
+            tooltip_text=_("Paste GitHub API template"),
+        )
+        template_btn.add_css_class(CSS_FLAT)
         template_btn.connect("clicked", self._on_use_github_template)
         self.update_url_row.add_suffix(template_btn)
         update_group.add(self.update_url_row)
 
         # Filename pattern
-        self.update_pattern_row = Adw.EntryRow()
-        self.update_pattern_row.set_title(_("Filename Pattern"))
+        self.update_pattern_row = Adw.EntryRow(title=_("Filename Pattern"))
         self.update_pattern_row.set_text("*-x86_64.AppImage")
         update_group.add(self.update_pattern_row)
 
         # Interval
-        self.update_interval_row = Adw.ComboRow()
-        self.update_interval_row.set_title(_("Check Interval"))
-        self.update_interval_row.set_subtitle(_("How often to check for updates"))
-
-        interval_model = Gtk.StringList()
-        for lbl in [
-            _("Every hour"),
-            _("Every 12 hours"),
-            _("Every 24 hours (recommended)"),
-            _("Custom"),
-        ]:
-            interval_model.append(lbl)
+        self.update_interval_row = Adw.ComboRow(
+            title=_("Check Interval"), subtitle=_("How often to check for updates")
+        )
+
+        # Models are filled in one call rather than one append per entry
+        interval_model = Gtk.StringList.new(
+            [
+                _("Every hour"),
+                _("Every 12 hours"),
+                _("Every 24 hours (recommended)"),
+                _("Custom"),
+            ]
+        )
         self.update_interval_row.set_model(interval_model)
         self.update_interval_row.set_selected(2)
         self.update_interval_row.connect("notify::selected", self._on_interval_changed)
@@ -701,12 +713,12 @@ class ConfigurationPage:
         continue_group = Adw.PreferencesGroup()
         continue_group.set_margin_top(8)
 
-        continue_row = Adw.ActionRow()
-        continue_row.set_title(_("Continue"))
-        continue_row.set_subtitle(_("Review build settings"))
+        continue_row = Adw.ActionRow(
+            title=_("Continue"), subtitle=_("Review build settings")
+        )
 
         self.continue_button = Gtk.Button(label=_("Continue"))
-        self.continue_button.add_css_class("suggested-action")
+        self.continue_button.add_css_class(CSS_SUGGESTED)
         self.continue_button.set_valign(Gtk.Align.CENTER)
         continue_row.add_suffix(self.continue_button)
         continue_row.set_activatable_widget(self.continue_button)
@@ -729,6 +741,43 @@ class ConfigurationPage:
             if not cur or cur == "*-x86_64.AppImage":
                 self.update_pattern_row.set_text(new_pat)
 
+    def _on_help_first_expanded(self, expander, _param):
+        if not expander.get_expanded():
+            return
+        expander.disconnect(self._help_expanded_handler)
+
+        help_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
+        help_box.set_margin_start(12)
+        help_box.set_margin_end(12)
+        help_box.set_margin_top(6)
+        help_box.set_margin_bottom(6)
+
+        help_text = Gtk.Label()
+        help_text.set_markup(
+            _(
+                "<b>GitHub Releases (recommended):</b>\n"
+                "Click the button next to Update URL to fill with template,"
+                " then edit OWNER/REPO\n\n"
+                "<b>Example:</b>\n"
+                "https://api.github.com/repos/biglinux/"
+                "big-video-converter/releases/latest\n\n"
+                "<b>Filename Pattern:</b>\n"
+                "Used to identify which file to download from the release.\n"
+                "The asterisk (*) matches any text.\n\n"
+                "<b>Pattern Examples:</b>\n"
+                "• myapp-*-x86_64.AppImage  → matches: "
+                "myapp-v1.2.3-x86_64.AppImage\n"
+                "• *-gui-*.AppImage  → matches: converter-gui-1.0.AppImage\n"
+                "• calculator-*.AppImage  → matches: "
+                "calculator-2.5-linux.AppImage"
+            )
+        )
+        help_text.set_wrap(True)
+        help_text.set_xalign(0)
+        help_box.append(help_text)
+
+        expander.add_row(help_box)
+
     def _on_interval_changed(self, combo_row, _param):
         self.custom_interval_row.set_visible(combo_row.get_selected() == 3)
 
@@ -753,104 +802,105 @@ class BuildPage:
         toolbar_view.set_content(scrolled)
 
         # ---- Output ----
-        output_group = Adw.PreferencesGroup()
-        output_group.set_title(_("Output Settings"))
+        output_group = Adw.PreferencesGroup(title=_("Output Settings"))
 
-        self.output_row = Adw.ActionRow()
-        self.output_row.set_title(_("Output Directory"))
-        self.output_row.set_subtitle(str(Path.cwd()))
-
-        self.output_button = Gtk.Button(label=_("Choose Folder"))
-        self.output_button.set_valign(Gtk.Align.CENTER)
-        self.output_row.add_suffix(self.output_button)
+        self.output_row, self.output_button = _make_button_row(
+            _("Choose Folder"), title=_("Output Directory")
+        )
+        # The default (working directory) is filled in when the page is
+        # first shown, keeping the getcwd() call off window construction.
+        self._output_showing_handler = self.nav_page.connect(
+            "showing", self._on_first_showing
+        )
         output_group.add(self.output_row)
 
         content_box.append(output_group)
 
         # ---- Build Environment ----
-        env_group = Adw.PreferencesGroup()
-        env_group.set_title(_("Build Environment"))
-        env_group.set_description(_("Choose where to build the AppImage"))
+        env_group = Adw.PreferencesGroup(
+            title=_("Build Environment"),
+            description=_("Choose where to build the AppImage"),
+        )
 
-        self.environment_row = Adw.ComboRow()
-        self.environment_row.set_title(_("Build Environment"))
-        self.environment_row.set_subtitle(_("Select container or use local system"))
+        self.environment_row = Adw.ComboRow(
+            title=_("Build Environment"),
+            subtitle=_("Select container or use local system"),
+        )
 
-        self.env_model = Gtk.StringList()
-        self.env_model.append(_("Local System (Current Python)"))
+        self.env_model = Gtk.StringList.new([_("Local System (Current Python)")])
         self.environment_row.set_model(self.env_model)
         self.environment_row.set_selected(0)
         # Parallel mapping to env_model entries: None = Local, str = container id.
         self.env_ids = [None]
+        # env id -> position in env_model, for restoring a selection
+        self.env_index = {None: 0}
+        # env_ids the model was last rebuilt from (None before the first one)
+        self._env_model_ids: list[str | None] | None = None
         env_group.add(self.environment_row)
 
         # Manage environments expander
-        self.env_expander = Adw.ExpanderRow()
-        self.env_expander.set_title(_("Manage Build Environments"))
-        self.env_expander.set_subtitle(_("Setup or remove build containers"))
-        self.env_expander.set_show_enable_switch(False)
+        self.env_expander = Adw.ExpanderRow(
+            title=_("Manage Build Environments"),
+            subtitle=_("Setup or remove build containers"),
+            show_enable_switch=False,
+        )
         env_group.add(self.env_expander)
 
-        self.environments_listbox = Gtk.ListBox()
-        self.environments_listbox.set_selection_mode(Gtk.SelectionMode.NONE)
-        self.environments_listbox.add_css_class("boxed-list")
+        self.environments_listbox = Gtk.ListBox(selection_mode=Gtk.SelectionMode.NONE)
+        self.environments_listbox.add_css_class(CSS_BOXED_LIST)
         self.env_expander.add_row(self.environments_listbox)
 
         # Callbacks for environment management (set by window)
         self.on_setup_clicked_callback = None
         self.on_remove_clicked_callback = None
+        # (id, status) pairs environments_listbox was last built from
+        self._env_signature: tuple | None = None
 
         content_box.append(env_group)
 
         # ---- Dependencies ----
-        deps_group = Adw.PreferencesGroup()
-        deps_group.set_title(_("Dependencies"))
+        deps_group = Adw.PreferencesGroup(title=_("Dependencies"))
 
-        self.deps_row = Adw.SwitchRow()
-        self.deps_row.set_title(_("Include Dependencies"))
-        self.deps_row.set_subtitle(_("Automatically include system dependencies"))
+        self.deps_row = Adw.SwitchRow(
+            title=_("Include Dependencies"),
+            subtitle=_("Automatically include system dependencies"),
+        )
         self.deps_row.set_active(True)
         deps_group.add(self.deps_row)
 
-        self.deps_expander_row = Adw.ExpanderRow()
-        self.deps_expander_row.set_title(_("System Dependencies"))
-        self.deps_expander_row.set_subtitle(
-            _("Select which system libraries to bundle")
+        self.deps_expander_row = Adw.ExpanderRow(
+            title=_("System Dependencies"),
+            subtitle=_("Select which system libraries to bundle"),
+            show_enable_switch=False,
         )
-        self.deps_expander_row.set_show_enable_switch(False)
         deps_group.add(self.deps_expander_row)
 
-        self.deps_list_box = Gtk.ListBox()
-        self.deps_list_box.set_selection_mode(Gtk.SelectionMode.NONE)
-        self.deps_list_box.add_css_class("boxed-list")
+        self.deps_list_box = Gtk.ListBox(selection_mode=Gtk.SelectionMode.NONE)
+        self.deps_list_box.add_css_class(CSS_BOXED_LIST)
         self.deps_expander_row.add_row(self.deps_list_box)
 
         content_box.append(deps_group)
 
         # ---- Icon Theme ----
-        theme_group = Adw.PreferencesGroup()
-        theme_group.set_title(_("Icon Theme"))
+        theme_group = Adw.PreferencesGroup(title=_("Icon Theme"))
 
-        self.icon_theme_row = Adw.SwitchRow()
-        self.icon_theme_row.set_title(_("Include Icon Theme"))
-        self.icon_theme_row.set_subtitle(
-            _("Bundle icons for consistent UI across systems")
+        self.icon_theme_row = Adw.SwitchRow(
+            title=_("Include Icon Theme"),
+            subtitle=_("Bundle icons for consistent UI across systems"),
         )
         self.icon_theme_row.set_active(True)
         theme_group.add(self.icon_theme_row)
 
-        self.icon_theme_expander_row = Adw.ExpanderRow()
-        self.icon_theme_expander_row.set_title(_("Icon Theme Selection"))
-        self.icon_theme_expander_row.set_subtitle(
-            _("Choose which icon theme to bundle")
+        self.icon_theme_expander_row = Adw.ExpanderRow(
+            title=_("Icon Theme Selection"),
+            subtitle=_("Choose which icon theme to bundle"),
+            show_enable_switch=False,
         )
-        self.icon_theme_expander_row.set_show_enable_switch(False)
         theme_group.add(self.icon_theme_expander_row)
 
-        papirus_row = Adw.ActionRow()
-        papirus_row.set_title(_("Papirus"))
-        papirus_row.set_subtitle(
-            _("Modern, colorful icons (~6.4MB) - Default for GTK apps")
+        papirus_row = Adw.ActionRow(
+            title=_("Papirus"),
+            subtitle=_("Modern, colorful icons (~6.4MB) - Default for GTK apps"),
         )
         self.papirus_radio = Gtk.CheckButton()
         self.papirus_radio.set_active(True)
@@ -858,9 +908,9 @@ class BuildPage:
         papirus_row.set_activatable_widget(self.papirus_radio)
         self.icon_theme_expander_row.add_row(papirus_row)
 
-        adwaita_row = Adw.ActionRow()
-        adwaita_row.set_title(_("Adwaita"))
-        adwaita_row.set_subtitle(_("GNOME default icons (~2.6MB)"))
+        adwaita_row = Adw.ActionRow(
+            title=_("Adwaita"), subtitle=_("GNOME default icons (~2.6MB)")
+        )
         self.adwaita_radio = Gtk.CheckButton()
         self.adwaita_radio.set_group(self.papirus_radio)
         adwaita_row.add_prefix(self.adwaita_radio)
@@ -870,37 +920,33 @@ class BuildPage:
         content_box.append(theme_group)
 
         # ---- Advanced ----
-        advanced_group = Adw.PreferencesGroup()
-        advanced_group.set_title(_("Advanced Options"))
+        advanced_group = Adw.PreferencesGroup(title=_("Advanced Options"))
 
-        self.strip_row = Adw.SwitchRow()
-        self.strip_row.set_title(_("Strip Debug Symbols"))
-        self.strip_row.set_subtitle(_("Reduce file size by removing debug information"))
+        self.strip_row = Adw.SwitchRow(
+            title=_("Strip Debug Symbols"),
+            subtitle=_("Reduce file size by removing debug information"),
+        )
         self.strip_row.set_active(False)
         advanced_group.add(self.strip_row)
 
         content_box.append(advanced_group)
 
         # ---- Additional Libraries ----
-        self._extra_libs_group = Adw.PreferencesGroup()
-        self._extra_libs_group.set_title(_("Additional Libraries"))
-        self._extra_libs_group.set_description(
-            _(
+        self._extra_libs_group = Adw.PreferencesGroup(
+            title=_("Additional Libraries"),
+            description=_(
                 "Specify extra .so library files to bundle. "
                 "Use file name patterns (e.g. 'libcurl.so*', 'libssl.so.3'). "
                 "Do NOT use package names like 'libcurl-dev' — only .so file names."
-            )
+            ),
         )
 
-        self.extra_lib_entry = Adw.EntryRow()
-        self.extra_lib_entry.set_title(_("e.g. libexample.so*"))
+        self.extra_lib_entry = Adw.EntryRow(title=_("e.g. libexample.so*"))
         self.extra_lib_entry.set_show_apply_button(True)
         self.extra_lib_entry.connect("apply", self._on_add_extra_lib)
 
-        add_btn = Gtk.Button()
-        add_btn.set_icon_name("list-add-symbolic")
-        add_btn.set_tooltip_text(_("Add library"))
-        add_btn.add_css_class("flat")
+        add_btn = Gtk.Button(icon_name=ICON_ADD, tooltip_text=_("Add library"))
+        add_btn.add_css_class(CSS_FLAT)
         add_btn.set_valign(Gtk.Align.CENTER)
         add_btn.connect("clicked", self._on_add_extra_lib)
         self.extra_lib_entry.add_suffix(add_btn)
@@ -916,12 +962,13 @@ class BuildPage:
         build_group = Adw.PreferencesGroup()
         build_group.set_margin_top(8)
 
-        build_row = Adw.ActionRow()
-        build_row.set_title(_("Create AppImage"))
-        build_row.set_subtitle(_("Generate your distributable AppImage file"))
+        build_row = Adw.ActionRow(
+            title=_("Create AppImage"),
+            subtitle=_("Generate your distributable AppImage file"),
+        )
 
         self.build_button = Gtk.Button(label=_("Create AppImage"))
-        self.build_button.add_css_class("suggested-action")
+        self.build_button.add_css_class(CSS_SUGGESTED)
         self.build_button.set_valign(Gtk.Align.CENTER)
         self.build_button.set_sensitive(False)
         build_row.add_suffix(self.build_button)
@@ -930,6 +977,11 @@ class BuildPage:
 
         content_box.append(build_group)
 
+    def _on_first_showing(self, nav_page):
+        nav_page.disconnect(self._output_showing_handler)
+        if not self.output_row.get_subtitle():
+            self.output_row.set_subtitle(str(Path.cwd()))
+
     # -- Extra libs API --
 
     def _on_add_extra_lib(self, _widget):
@@ -941,14 +993,12 @@ class BuildPage:
         self.extra_lib_entry.set_text("")
 
     def _add_lib_row(self, lib_name: str):
-        row = Adw.ActionRow()
-        row.set_title(lib_name)
-        row.set_icon_name("application-x-sharedlib-symbolic")
-
-        remove_btn = Gtk.Button()
-        remove_btn.set_icon_name("edit-delete-symbolic")
-        remove_btn.set_tooltip_text(_("Remove"))
-        remove_btn.add_css_class("flat")
+        row = Adw.ActionRow(
+            title=lib_name, icon_name="application-x-sharedlib-symbolic"
+        )
+
+        remove_btn = Gtk.Button(icon_name=ICON_DELETE, tooltip_text=_("Remove"))
+        remove_btn.add_css_class(CSS_FLAT)
         remove_btn.set_valign(Gtk.Align.CENTER)
         remove_btn.connect("clicked", self._remove_extra_lib, lib_name, row)
         row.add_suffix(remove_btn)
@@ -978,15 +1028,22 @@ class BuildPage:
 
     def update_environments(self, env_manager: EnvironmentManager) -> None:
         """Populate the environment expander with available containers."""
-        child = self.environments_listbox.get_first_child()
-        while child:
-            nxt = child.get_next_sibling()
-            self.environments_listbox.remove(child)
-            child = nxt
-
-        for env in env_manager.get_supported_environments():
-            row = Adw.ActionRow()
-            row.set_title(env["name"])
+        environments = env_manager.get_supported_environments()
+
+        # Nothing to do when no container changed status since the last call
+        signature = tuple((env["id"], env["status"]) for env in environments)
+        if signature == self._env_signature:
+            return
+        self._env_signature = signature
+
+        # Hide the list while it is rebuilt so GTK lays it out once at the
+        # end instead of after every append.
+        self.environments_listbox.set_visible(False)
+
+        clear_list_box(self.environments_listbox)
+
+        for env in environments:
+            row = Adw.ActionRow(title=env["name"])
             desc = env["description"]
 
             # Show "★ Recommended" badge
@@ -994,71 +1051,81 @@ class BuildPage:
             if is_recommended:
                 desc = desc.replace(_("Recommended") + " - ", "")
                 badge = Gtk.Label(label=_("★ Recommended"))
-                badge.add_css_class("accent")
+                badge.add_css_class(CSS_ACCENT)
                 badge.set_valign(Gtk.Align.CENTER)
                 row.add_suffix(badge)
 
             row.set_subtitle(desc)
 
             if env["status"] == "ready":
-                icon = Gtk.Image.new_from_icon_name("emblem-ok-symbolic")
+                icon = Gtk.Image.new_from_icon_name(ICON_OK)
                 row.add_suffix(icon)
 
-                remove_button = Gtk.Button(label=_("Remove"))
-                remove_button.set_valign(Gtk.Align.CENTER)
-                remove_button.add_css_class("destructive-action")
-                remove_button.connect(
-                    "clicked",
-                    lambda btn, eid=env["id"]: (
-                        self.on_remove_clicked_callback(eid)
-                        if self.on_remove_clicked_callback
-                        else None
-                    ),
+                remove_button = Gtk.Button(
+                    label=_("Remove"),
+                    valign=Gtk.Align.CENTER,
+                    css_classes=[CSS_DESTRUCTIVE],
                 )
+                remove_button.env_id = env["id"]  # type: ignore[attr-defined]
+                remove_button.connect("clicked", self._on_remove_button_clicked)
                 row.add_suffix(remove_button)
             else:
-                setup_button = Gtk.Button(label=_("Setup"))
-                setup_button.set_valign(Gtk.Align.CENTER)
-                setup_button.connect(
-                    "clicked",
-                    lambda btn, eid=env["id"]: (
-                        self.on_setup_clicked_callback(eid)
-                        if self.on_setup_clicked_callback
-                        else None
-                    ),
-                )
+                setup_button = Gtk.Button(label=_("Setup"), valign=Gtk.Align.CENTER)
+                setup_button.env_id = env["id"]  # type: ignore[attr-defined]
+                setup_button.connect("clicked", self._on_setup_button_clicked)
                 row.add_suffix(setup_button)
 
             self.environments_listbox.append(row)
 
-    def update_env_model(self, env_manager: EnvironmentManager) -> None:
-        """Update the environment ComboRow model.
+        self.environments_listbox.set_visible(True)
+
+    def _on_setup_button_clicked(self, button: Gtk.Button) -> None:
+        if self.on_setup_clicked_callback:
+            self.on_setup_clicked_callback(button.env_id)
+
+    def _on_remove_button_clicked(self, button: Gtk.Button) -> None:
+        if self.on_remove_clicked_callback:
+            self.on_remove_clicked_callback(button.env_id)
+
+    def update_env_model(
+        self, env_manager: EnvironmentManager, selected_id: str | None = None
+    ) -> None:
+        """Update the environment ComboRow model and select ``selected_id``
+        (the first entry when it is not offered).
 
         When at least one container is ready, the Local option is hidden so
         builds default to a container (better AppImage portability — building on
         the host links against its bleeding-edge libraries). Local reappears only
         as a fallback when no container is ready.
         """
-        self.env_model.splice(0, self.env_model.get_n_items())
-        self.env_ids = []
-
-        ready = [
-            env
-            for env in env_manager.get_supported_environments()
-            if env["status"] == "ready"
-        ]
-
-        for env in ready:
-            self.env_model.append(f"{env['name']} (Container)")
-            self.env_ids.append(env["id"])
+        # Labels and ids of the ready containers
+        labels: list[str] = []
+        env_ids: list[str | None] = []
+        for env in env_manager.get_ready_environments():
+            labels.append(f"{env['name']} (Container)")
+            env_ids.append(env["id"])
+        ready = bool(env_ids)
 
         # Local is offered only when there is no ready container to fall back on.
         if not ready:
-            self.env_model.append(_("Local System (Current Python)"))
-            self.env_ids.append(None)
+            labels.append(_("Local System (Current Python)"))
+            env_ids.append(None)
+
+        # Same entries as the model already shows: only the selection may move
+        if env_ids == self._env_model_ids:
+            index = self.env_index.get(selected_id, 0)
+            if self.environment_row.get_selected() != index:
+                self.environment_row.set_selected(index)
+            return
+        self._env_model_ids = env_ids
+        self.env_ids = list(env_ids)
+        self.env_index = {env_id: i for i, env_id in enumerate(env_ids)}
+
+        # Swap the whole model in one splice so the ComboRow sees a single
+        # items-changed instead of one per entry
+        self.env_model.splice(0, self.env_model.get_n_items(), labels)
 
-        if self.env_model.get_n_items() > 0:
-            self.environment_row.set_selected(0)
+        self.environment_row.set_selected(self.env_index.get(selected_id, 0))
 
         # Keep the subtitle honest about what is available.
         if ready:
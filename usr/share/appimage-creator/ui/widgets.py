@@ -8,9 +8,31 @@ import gi
 gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
 
-from gi.repository import Gtk, Adw
+from gi.repository import Gtk, Adw, Gio, GObject
 from utils.i18n import _
 
+# Gtk.ListBox.remove_all() (GTK 4.12+) clears a list in a single call
+_HAS_REMOVE_ALL = hasattr(Gtk.ListBox, "remove_all")
+
+
+def clear_list_box(list_box: Gtk.ListBox) -> None:
+    """Remove every row from a Gtk.ListBox"""
+    if _HAS_REMOVE_ALL:
+        list_box.remove_all()
+        return
+    child = list_box.get_first_child()
+    while child:
+        next_child = child.get_next_sibling()
+        list_box.remove(child)
+        child = next_child
+
+
+def _disconnect(handler: tuple[Gtk.Button, int] | None) -> None:
+    """Disconnect a (widget, handler id) pair recorded when a row was built"""
+    if handler is not None:
+        widget, handler_id = handler
+        widget.disconnect(handler_id)
+
 
 class DynamicEntryList:
     """Manages a list of entry rows (for authors, websites, etc)"""
@@ -19,52 +41,80 @@ class DynamicEntryList:
         self.list_box = list_box
         self.title_format = title_format
         self.allow_empty = allow_empty
-        self.entries = []
+        # id(row) -> row, in insertion (display) order
+        self.entries: dict[int, Adw.EntryRow] = {}
+        self._title_cache: dict[int, str] = {}
+        # id(row) -> (remove button, handler id), for rows that have one
+        self._handlers: dict[int, tuple[Gtk.Button, int]] = {}
 
     def add_entry(self, initial_text: str = "") -> Adw.EntryRow:
         """Add a new entry field"""
         row = Adw.EntryRow()
-        row.set_title(self.title_format.format(len(self.entries) + 1))
+        row.set_title(self._title(len(self.entries) + 1))
         row.set_text(initial_text)
 
         # Remove button (not for first entry if not allow_empty)
-        if len(self.entries) > 0 or self.allow_empty:
-            remove_button = Gtk.Button.new_from_icon_name("edit-delete-symbolic")
-            remove_button.set_valign(Gtk.Align.CENTER)
-            remove_button.set_tooltip_text(_("Remove"))
-            remove_button.add_css_class("destructive-action")
-            remove_button.connect("clicked", lambda btn: self.remove_entry(row))
+        if self.entries or self.allow_empty:
+            remove_button = Gtk.Button(
+                icon_name="edit-delete-symbolic",
+                valign=Gtk.Align.CENTER,
+                tooltip_text=_("Remove"),
+                css_classes=["destructive-action"],
+            )
+            handler_id = remove_button.connect("clicked", self._on_remove_clicked)
+            self._handlers[id(row)] = (remove_button, handler_id)
             row.add_suffix(remove_button)
 
-        self.entries.append(row)
+        self.entries[id(row)] = row
         self.list_box.append(row)
         return row
 
     def remove_entry(self, row: Adw.EntryRow) -> None:
         """Remove an entry field"""
-        if row in self.entries:
-            self.entries.remove(row)
-            self.list_box.remove(row)
-            self._update_titles()
-
-    def _update_titles(self):
-        """Update entry titles after removal"""
-        for i, entry in enumerate(self.entries):
-            entry.set_title(self.title_format.format(i + 1))
-
-    def get_values(self) -> list[str]:
+        key = id(row)
+        if key not in self.entries:
+            return
+        index = list(self.entries).index(key)
+        del self.entries[key]
+        _disconnect(self._handlers.pop(key, None))
+        self.list_box.remove(row)
+        self._update_titles(index)
+
+    def _on_remove_clicked(self, button: Gtk.Button) -> None:
+        # The button lives inside its row; look the row up rather than
+        # holding a reference to it from the signal handler.
+        self.remove_entry(button.get_ancestor(Adw.EntryRow))
+
+    def _update_titles(self, start: int = 0):
+        """Update entry titles from position ``start`` on after removal"""
+        entries = list(self.entries.values())
+        for i in range(start, len(entries)):
+            entries[i].set_title(self._title(i + 1))
+
+    def _title(self, number: int) -> str:
+        """Return the formatted title for the given entry number"""
+        title = self._title_cache.get(number)
+        if title is None:
+            title = self._title_cache[number] = self.title_format.format(number)
+        return title
+
+    def get_values(self) -> tuple[str, ...]:
         """Get all non-empty values"""
-        return [
-            entry.get_text().strip()
-            for entry in self.entries
-            if entry.get_text().strip()
-        ]
+        strip = str.strip
+        return tuple(
+            text
+            for entry in self.entries.values()
+            if (text := strip(entry.get_text()))
+        )
 
     def clear(self) -> None:
         """Clear all entries"""
-        for entry in list(self.entries):
+        for entry in self.entries.values():
             self.list_box.remove(entry)
+        for handler in self._handlers.values():
+            _disconnect(handler)
         self.entries.clear()
+        self._handlers.clear()
 
 
 class DirectoryListWidget:
@@ -72,99 +122,249 @@ class DirectoryListWidget:
 
     def __init__(self, list_box, on_remove_callback=None):
         self.list_box = list_box
-        self.directories = []
+        # path -> basename, in insertion (display) order
+        self.directories: dict[str, str] = {}
         self.on_remove_callback = on_remove_callback
+        self._rows: dict[str, Adw.ActionRow] = {}
+        # path -> (remove button, handler id)
+        self._handlers: dict[str, tuple[Gtk.Button, int]] = {}
+        self._remove_label = _("Remove")
+        # Snapshot returned by get_directories(); None after any change
+        self._paths: tuple[str, ...] | None = None
 
     def add_directory(self, path: str) -> None:
         """Add directory to list"""
-        if path not in self.directories:
-            self.directories.append(path)
-            self._refresh_list()
+        if path in self.directories:
+            return
+        self.directories[path] = os.path.basename(path)
+        self._paths = None
+        self._add_row(path)
 
     def remove_directory(self, path: str) -> None:
         """Remove directory from list"""
-        if path in self.directories:
-            self.directories.remove(path)
-            self._refresh_list()
-            if self.on_remove_callback:
-                self.on_remove_callback(path)
-
-    def _refresh_list(self):
-        """Refresh the list display"""
-        # Clear existing rows
-        child = self.list_box.get_first_child()
-        while child:
-            next_child = child.get_next_sibling()
-            self.list_box.remove(child)
-            child = next_child
-
-        # Add current directories
-        for directory in self.directories:
-            row = Adw.ActionRow()
-            row.set_title(os.path.basename(directory))
-            row.set_subtitle(directory)
-
-            remove_button = Gtk.Button(label=_("Remove"))
-            remove_button.set_valign(Gtk.Align.CENTER)
-            remove_button.add_css_class("destructive-action")
-            remove_button.connect(
-                "clicked", lambda btn, path=directory: self.remove_directory(path)
-            )
-            row.add_suffix(remove_button)
+        if self.directories.pop(path, None) is None:
+            return
+        self._paths = None
+        _disconnect(self._handlers.pop(path))
+        self.list_box.remove(self._rows.pop(path))
+        if self.on_remove_callback:
+            self.on_remove_callback(path)
+
+    def _add_row(self, directory: str) -> None:
+        """Append the row for a single directory"""
+        row = Adw.ActionRow()
+        row.set_title(self.directories[directory])
+        row.set_subtitle(directory)
+
+        remove_button = Gtk.Button(
+            label=self._remove_label,
+            valign=Gtk.Align.CENTER,
+            css_classes=["destructive-action"],
+        )
+        handler_id = remove_button.connect(
+            "clicked", self._on_remove_clicked, directory
+        )
+        self._handlers[directory] = (remove_button, handler_id)
+        row.add_suffix(remove_button)
+
+        self.list_box.append(row)
+        self._rows[directory] = row
 
-            self.list_box.append(row)
+    def _on_remove_clicked(self, _button: Gtk.Button, path: str) -> None:
+        self.remove_directory(path)
 
-    def get_directories(self) -> list[str]:
+    def get_directories(self) -> tuple[str, ...]:
         """Get list of directories"""
-        return self.directories.copy()
+        if self._paths is None:
+            self._paths = tuple(self.directories)
+        return self._paths
 
     def clear(self) -> None:
         """Clear all directories"""
+        for row in self._rows.values():
+            self.list_box.remove(row)
+        for handler in self._handlers.values():
+            _disconnect(handler)
+        self._rows.clear()
+        self._handlers.clear()
         self.directories.clear()
-        self._refresh_list()
+        self._paths = None
+
+
+class _DetectedFile(GObject.Object):
+    """Item of the detected-files list view"""
+
+    def __init__(self, title: str, subtitle: str):
+        super().__init__()
+        self.title = title
+        self.subtitle = subtitle
 
 
 class DetectedFilesWidget:
     """Widget to display auto-detected files"""
 
+    # Above this many files the rows go into a Gtk.ListView, which only
+    # creates widgets for the rows that are scrolled into view
+    LIST_VIEW_THRESHOLD = 200
+    # Height of the scrolled area holding the list view
+    LIST_VIEW_HEIGHT = 400
+    # Upper bound for remembered row subtitles (oldest dropped first)
+    SUBTITLE_CACHE_SIZE = 10000
+
     def __init__(self, list_box):
         self.list_box = list_box
+        # (file_type, file_path) -> row currently shown
+        self._shown: dict[tuple[str, str], Adw.ActionRow] = {}
+        # Keys of the shown rows, in list order
+        self._order: list[tuple[str, str]] = []
+        # Snapshot of the detected files the list was last built from
+        self._fingerprint: tuple | None = None
+        # (file_type, file_path) -> subtitle, kept across updates
+        self._subtitle_cache: dict[tuple[str, str], str] = {}
+        # List view for large results, created on first need
+        self._store: Gio.ListStore | None = None
+        self._scrolled: Gtk.ScrolledWindow | None = None
 
     def update(self, detected_files: dict) -> None:
         """Update with detected files"""
-        # Clear existing
-        child = self.list_box.get_first_child()
-        while child:
-            next_child = child.get_next_sibling()
-            self.list_box.remove(child)
-            child = next_child
-
-        # Filter out desktop files (they have their own section)
-        filtered_files = {
-            k: v for k, v in detected_files.items() if k != "desktop_files"
-        }
-
-        # Add detected files
-        for file_type, files in filtered_files.items():
-            if files:
-                for file_path in files:
-                    row = Adw.ActionRow()
-                    row.set_title(os.path.basename(file_path))
-                    row.set_subtitle(
-                        _("{}: {}").format(
-                            file_type.replace("_", " ").title(), file_path
-                        )
-                    )
-
-                    icon = Gtk.Image.new_from_icon_name("emblem-default-symbolic")
-                    row.add_prefix(icon)
-
-                    self.list_box.append(row)
+        # Non-empty file groups as (file_type, label, files), skipping desktop
+        # files (they have their own section)
+        items = [
+            (file_type, file_type.replace("_", " ").title(), files)
+            for file_type, files in detected_files.items()
+            if files and file_type != "desktop_files"
+        ]
+
+        fingerprint = tuple((file_type, tuple(files)) for file_type, _l, files in items)
+        if fingerprint == self._fingerprint:
+            return
+        self._fingerprint = fingerprint
+
+        if sum(len(files) for _t, _l, files in items) > self.LIST_VIEW_THRESHOLD:
+            self._show_list_view(items)
+            return
+        if self._scrolled is not None:
+            self._scrolled.set_visible(False)
+            self._store.remove_all()
+
+        new_order = [
+            (file_type, file_path)
+            for file_type, _l, files in items
+            for file_path in files
+        ]
+        new_keys = set(new_order)
+
+        # Hide the list while rows change so GTK lays it out once at the end
+        self.list_box.set_visible(False)
+
+        # Rows can only be kept if they stay in the same relative order;
+        # otherwise drop them all and rebuild
+        kept_old = [key for key in self._order if key in new_keys]
+        kept_new = [key for key in new_order if key in self._shown]
+        stale = (
+            self._shown.keys() - new_keys if kept_old == kept_new else list(self._shown)
+        )
+
+        # Drop rows for files that are no longer detected
+        for key in stale:
+            self.list_box.remove(self._shown.pop(key))
+
+        # Add rows only for newly detected files
+        subtitle_format = _("{}: {}")
+        gicon = Gio.ThemedIcon.new("emblem-default-symbolic")
+        basename = os.path.basename
+        insert = self.list_box.insert
+        index = -1
+        for file_type, type_label, files in items:
+            for file_path in files:
+                index += 1
+                key = (file_type, file_path)
+                if key in self._shown:
+                    continue
+                row = Adw.ActionRow()
+                row.set_title(basename(file_path))
+                row.set_subtitle(self._subtitle(key, subtitle_format, type_label))
+
+                row.add_prefix(Gtk.Image.new_from_gicon(gicon))
+
+                # Place the row at its position in the detected order
+                insert(row, index)
+                self._shown[key] = row
+        self._order = new_order
+
+        self.list_box.set_visible(True)
+
+    def _show_list_view(self, items: list) -> None:
+        """Show the files in the list view instead of one row each"""
+        if self._scrolled is None:
+            self._create_list_view()
+        # The list box rows are not needed while the list view is shown
+        self.list_box.set_visible(False)
+        clear_list_box(self.list_box)
+        self._shown.clear()
+        self._order.clear()
+
+        subtitle_format = _("{}: {}")
+        basename = os.path.basename
+        self._store.splice(
+            0,
+            self._store.get_n_items(),
+            [
+                _DetectedFile(
+                    basename(file_path),
+                    self._subtitle((file_type, file_path), subtitle_format, type_label),
+                )
+                for file_type, type_label, files in items
+                for file_path in files
+            ],
+        )
+        self._scrolled.set_visible(True)
+
+    def _create_list_view(self) -> None:
+        """Build the list view and place it next to the list box"""
+        self._store = Gio.ListStore(item_type=_DetectedFile)
+        factory = Gtk.SignalListItemFactory()
+        factory.connect("setup", self._on_item_setup)
+        factory.connect("bind", self._on_item_bind)
+        list_view = Gtk.ListView(
+            model=Gtk.NoSelection(model=self._store), factory=factory
+        )
+
+        self._scrolled = Gtk.ScrolledWindow(
+            hscrollbar_policy=Gtk.PolicyType.NEVER,
+            min_content_height=self.LIST_VIEW_HEIGHT,
+            child=list_view,
+        )
+        self._scrolled.add_css_class("card")
+        self.list_box.get_parent().insert_child_after(self._scrolled, self.list_box)
+
+    def _on_item_setup(self, _factory, list_item: Gtk.ListItem) -> None:
+        row = Adw.ActionRow()
+        row.add_prefix(Gtk.Image.new_from_icon_name("emblem-default-symbolic"))
+        list_item.set_child(row)
+
+    def _on_item_bind(self, _factory, list_item: Gtk.ListItem) -> None:
+        item = list_item.get_item()
+        row = list_item.get_child()
+        row.set_title(item.title)
+        row.set_subtitle(item.subtitle)
+
+    def _subtitle(self, key: tuple[str, str], fmt: str, type_label: str) -> str:
+        """Return the cached subtitle for a detected file"""
+        subtitle = self._subtitle_cache.get(key)
+        if subtitle is None:
+            if len(self._subtitle_cache) >= self.SUBTITLE_CACHE_SIZE:
+                del self._subtitle_cache[next(iter(self._subtitle_cache))]
+            subtitle = fmt.format(type_label, key[1])
+            self._subtitle_cache[key] = subtitle
+        return subtitle
 
     def clear(self) -> None:
         """Clear all displayed files"""
-        child = self.list_box.get_first_child()
-        while child:
-            next_child = child.get_next_sibling()
-            self.list_box.remove(child)
-            child = next_child
+        clear_list_box(self.list_box)
+        self._shown.clear()
+        self._order.clear()
+        if self._scrolled is not None:
+            self._scrolled.set_visible(False)
+            self._store.remove_all()
+        self._fingerprint = None
@@ -5,16 +5,29 @@ Flow: Welcome → Application → Configuration → Build
 """
 
 import os
+import queue
+import sys
 import threading
+from collections import deque
 from gi.repository import Gtk, Adw, GLib, Gio
 
-from core.builder import AppImageBuilder
 from core.app_info import AppInfo
+from core.build_config import SYSTEM_DEPENDENCIES
 from core.structure_analyzer import detect_application_structure
-from core.environment_manager import EnvironmentManager, SUPPORTED_ENVIRONMENTS
+from core.environment_manager import (
+    EnvironmentManager,
+    SUPPORTED_ENVIRONMENTS_BY_ID,
+)
 from core.settings import LibraryProfileManager, SettingsManager
 from templates.app_templates import get_app_type_from_file, get_available_categories
-from ui.pages import WelcomePage, ApplicationPage, ConfigurationPage, BuildPage
+from ui.pages import (
+    APP_TYPES,
+    APP_TYPE_INDEX,
+    WelcomePage,
+    ApplicationPage,
+    ConfigurationPage,
+    BuildPage,
+)
 from ui.dialogs import (
     BuildProgressDialog,
     LogProgressDialog,
@@ -27,6 +40,7 @@ from ui.dialogs import (
     show_structure_viewer,
     show_desktop_file_viewer,
 )
+from ui.widgets import clear_list_box
 from validators.validators import ValidationError, validate_app_name, validate_version
 from utils.i18n import _
 from utils.tooltip_helper import TooltipHelper
@@ -34,6 +48,65 @@ from utils.tooltip_helper import TooltipHelper
 # Application version – single source of truth
 APP_VERSION = "1.4.0"
 
+# Quiet period after the last keystroke before the inputs are validated
+VALIDATE_DELAY_MS = 120
+# Build log lines kept until the next idle flush (oldest dropped first)
+BUILD_LOG_BUFFER_SIZE = 4096
+
+# Refresh steps queued with _schedule_refresh() (bit flags, run in this order)
+_REFRESH_DETECTED = 1 << 0
+_REFRESH_DIRS = 1 << 1
+_REFRESH_DESKTOP = 1 << 2
+_REFRESH_PREVIEW = 1 << 3
+_REFRESH_DEPS = 1 << 4
+_REFRESH_VALIDATE = 1 << 5
+_REFRESH_ANALYSIS = (
+    _REFRESH_DETECTED
+    | _REFRESH_DIRS
+    | _REFRESH_DESKTOP
+    | _REFRESH_PREVIEW
+    | _REFRESH_DEPS
+    | _REFRESH_VALIDATE
+)
+
+# Messages used from handlers and worker threads, translated once
+_SELECTED = _("Selected: {}")
+_DETECTED = _("Detected: {}")
+_ERROR = _("Error: {}")
+_CREATING_CONTAINER = _("Creating container...")
+_INSTALLING_DEPENDENCIES = _("Installing dependencies (this may take a while)...")
+_SETUP_CANCELLED = _("Setup cancelled by user.")
+_REMOVING_CONTAINER = _("Removing container...")
+
+# Setup confirmation dialog; only the environment details vary per open
+_SETUP_HEADING = _("Setup Build Environment?")
+_SETUP_BODY = (
+    _(
+        "This will download and setup '{}'.\n\n"
+        "This process may take 5-15 minutes depending on your "
+        "internet connection.\n\nThe following will be installed:"
+    )
+    + "\n• Container image: {}"
+    + "\n• Build dependencies: {} packages"
+    + "\n\n"
+    + _("Do you want to continue?")
+)
+_SETUP_CANCEL = _("Cancel")
+_SETUP_CONFIRM = _("Setup Environment")
+
+# File chooser titles and filters, shared by every open of each chooser
+_CHOOSE_EXECUTABLE = _("Choose Executable")
+_CHOOSE_ICON = _("Choose Icon")
+_CHOOSE_DESKTOP_FILE = _("Choose Desktop File")
+_ADD_DIRECTORY = _("Add Directory")
+_CHOOSE_OUTPUT_DIR = _("Choose Output Directory")
+_EXECUTABLE_FILTERS = {
+    _("Executable Files"): ["*.py", "*.sh", "*.jar", "*"],
+    _("All Files"): ["*"],
+}
+_IMAGE_FILTERS = {_("Image Files"): ["*.png", "*.svg", "*.jpg", "*.ico"]}
+_DESKTOP_FILTERS = {_("Desktop Files"): ["*.desktop"]}
+
 
 class AppImageCreatorWindow(Adw.ApplicationWindow):
     """Main application window using a wizard (NavigationView) layout."""
@@ -43,15 +116,53 @@ class AppImageCreatorWindow(Adw.ApplicationWindow):
 
         # Data model
         self.app_info = AppInfo()
-        self.builder = AppImageBuilder()
+        # Whether app_info.executable existed when it was chosen; checked on
+        # every name keystroke, so not re-stat'ed each time
+        self._executable_exists = False
+        # Pending debounced _validate_inputs (GLib source id, 0 if none) and
+        # the status row state last shown (None while the row is hidden)
+        self._validate_source = 0
+        # Pending debounced update-pattern refresh from the name (0 if none)
+        self._name_pattern_source = 0
+        self._status_state: str | None = None
+        # _REFRESH_* steps waiting for the next _flush_refresh (0 if none)
+        self._pending_refresh = 0
+        # Whether the name row currently carries the "error" style class
+        self._name_error_css = False
+        # Stripped name row text, kept current by _on_name_changed
+        self._app_name = ""
+        # Created on first use; see the ``builder`` property
+        self._builder = None
         self.env_manager = EnvironmentManager()
         self.settings = SettingsManager()
         self.lib_profiles = LibraryProfileManager()
         self.structure_analysis = None
+        # detected_files dict the detected-files group was last built from
+        self._shown_detected: dict | None = None
         self.progress_dialog = None
+        self._about_window: Adw.AboutWindow | None = None
+        # Setup confirmation, built once and re-filled for each environment
+        self._setup_dialog: Adw.MessageDialog | None = None
+        self._setup_env_id: str | None = None
         self.dependency_switches: dict[str, Adw.SwitchRow] = {}
+        # The switches are created on first need, not at startup
+        self._deps_populated = False
+        # Keys of the switches currently on, kept by _on_dependency_toggled
+        self._active_deps: set[str] = set()
+        # (executable, mtime, type, project root) -> detected GUI frameworks
+        self._gui_deps_cache: dict[tuple, dict[str, bool]] = {}
         self.build_in_progress = False
+        # Build log lines from the builder thread, written out on idle
+        self._build_log: deque[str] = deque(maxlen=BUILD_LOG_BUFFER_SIZE)
+        self._build_log_flush_pending = False
+        # Latest (percentage, message) from the builder thread
+        self._build_progress: tuple[int, str] = (0, "")
+        self._build_progress_pending = False
         self.app_info.selected_dependencies = []
+        # Environment setup/removal run one at a time on a reused daemon
+        # worker (started on first use), so quitting never waits for them
+        self._env_jobs: queue.Queue = queue.Queue()
+        self._env_worker: threading.Thread | None = None
 
         # Wizard pages (created once, reused across navigations)
         self.welcome_page = WelcomePage()
@@ -69,9 +180,7 @@ class AppImageCreatorWindow(Adw.ApplicationWindow):
 
         self._setup_ui()
         self._setup_actions()
-        self._setup_builder_callbacks()
         self._connect_signals()
-        self._populate_dependency_switches()
         self._setup_tooltips()
 
         # Save window size on close
@@ -89,8 +198,22 @@ class AppImageCreatorWindow(Adw.ApplicationWindow):
         self.settings.set("window-width", self.get_width())
         self.settings.set("window-height", self.get_height())
         self.tooltip_helper.cleanup()
+        self._cancel_scheduled_validation()
+        if self._name_pattern_source:
+            GLib.source_remove(self._name_pattern_source)
+            self._name_pattern_source = 0
         return False
 
+    @property
+    def builder(self):
+        """AppImageBuilder, imported and created the first time it is needed"""
+        if self._builder is None:
+            from core.builder import AppImageBuilder
+
+            self._builder = AppImageBuilder()
+            self._setup_builder_callbacks()
+        return self._builder
+
     # ------------------------------------------------------------------
     #  Settings helpers
     # ------------------------------------------------------------------
@@ -146,9 +269,7 @@ class AppImageCreatorWindow(Adw.ApplicationWindow):
         self.welcome_page.continue_button.connect(
             "clicked", lambda _: self.nav_view.push(self.app_page.nav_page)
         )
-        self.app_page.continue_button.connect(
-            "clicked", lambda _: self.nav_view.push(self.config_page.nav_page)
-        )
+        self.app_page.continue_button.connect("clicked", self._on_continue_to_config)
         self.config_page.continue_button.connect("clicked", self._on_continue_to_build)
 
         # -- Application page --
@@ -157,7 +278,6 @@ class AppImageCreatorWindow(Adw.ApplicationWindow):
         self.app_page.desktop_button.connect(
             "clicked", self._on_choose_desktop_app_page
         )
-        self.app_page.name_row.connect("changed", self._validate_inputs)
         self.app_page.name_row.connect("changed", self._on_name_changed)
 
         # -- Configuration page --
@@ -189,12 +309,19 @@ class AppImageCreatorWindow(Adw.ApplicationWindow):
         )
         self.build_page.papirus_radio.connect("toggled", self._on_icon_theme_changed)
         self.build_page.adwaita_radio.connect("toggled", self._on_icon_theme_changed)
+        self.build_page.nav_page.connect(
+            "showing", lambda _page: self._ensure_dependency_switches()
+        )
 
         # -- Welcome page environment management --
         self.welcome_page.on_setup_clicked_callback = self._on_setup_environment_clicked
         self.welcome_page.on_remove_clicked_callback = (
             self._on_remove_environment_clicked
         )
+        # Resolve env_manager at click time: it is replaced after installing
+        self.welcome_page.on_install_clicked_callback = (
+            lambda: self._on_install_packages_clicked(self.env_manager)
+        )
 
     def _setup_tooltips(self) -> None:
         """Replace native tooltips with rich popover tooltips."""
@@ -222,6 +349,14 @@ class AppImageCreatorWindow(Adw.ApplicationWindow):
         th.add_tooltip(self.build_page.icon_theme_row, "icon_theme")
         th.add_tooltip(self.build_page.strip_row, "strip_symbols")
 
+    def _on_continue_to_config(self, button):
+        """Navigate to the Configuration page if the app inputs are valid."""
+        # A debounced validation may still be pending from the last keystroke
+        self._validate_now()
+        if not button.get_sensitive():
+            return
+        self.nav_view.push(self.config_page.nav_page)
+
     def _on_continue_to_build(self, _button):
         """Validate configuration inputs and navigate to the Build page."""
         # Validate version before proceeding
@@ -243,35 +378,37 @@ class AppImageCreatorWindow(Adw.ApplicationWindow):
             self.config_page.update_url_row.grab_focus()
             return
 
-        self.build_page.update_env_model(self.env_manager)
-        self.build_page.update_environments(self.env_manager)
-
         # Default selection: this session's choice, else the remembered one,
         # else the first entry (a container when any is ready, Local otherwise).
-        self._select_default_environment()
+        self.build_page.update_env_model(
+            self.env_manager, self._default_environment_id()
+        )
+        self.build_page.update_environments(self.env_manager)
 
         self.nav_view.push(self.build_page.nav_page)
 
-    def _select_default_environment(self) -> None:
-        """Pick the default build-environment entry in the ComboRow."""
-        env_ids = getattr(self.build_page, "env_ids", None)
-        if not env_ids:
-            return
-
+    def _default_environment_id(self) -> str | None:
+        """Return the build environment to preselect in the ComboRow."""
         target = self.app_info.build_environment
         if target is None:
             target = self.settings.get("default-build-environment")
-
-        idx = env_ids.index(target) if target in env_ids else 0
-        self.build_page.environment_row.set_selected(idx)
+        return target
 
     # ------------------------------------------------------------------
     #  About
     # ------------------------------------------------------------------
 
     def _on_about_clicked(self, _action, _param):
-        Adw.AboutWindow(
+        # Built once and hidden (not destroyed) on close, so reopening it
+        # only presents the existing window
+        if self._about_window is None:
+            self._about_window = self._create_about_window()
+        self._about_window.present()
+
+    def _create_about_window(self) -> Adw.AboutWindow:
+        return Adw.AboutWindow(
             transient_for=self,
+            hide_on_close=True,
             application_name=_("AppImage Creator"),
             application_icon="appimage-creator",
             version=APP_VERSION,
@@ -285,7 +422,7 @@ class AppImageCreatorWindow(Adw.ApplicationWindow):
             website="https://github.com/big-comm/appimage-creator",
             issue_url="https://github.com/big-comm/appimage-creator/issues",
             developers=["BigCommunity"],
-        ).present()
+        )
 
     # ------------------------------------------------------------------
     #  Icon theme
@@ -305,63 +442,118 @@ class AppImageCreatorWindow(Adw.ApplicationWindow):
     #  Validation
     # ------------------------------------------------------------------
 
+    def _schedule_validate_inputs(self, *_args):
+        """Validate once typing pauses instead of on every keystroke."""
+        self._cancel_scheduled_validation()
+        self._validate_source = GLib.timeout_add(
+            VALIDATE_DELAY_MS, self._on_validate_timeout
+        )
+
+    def _cancel_scheduled_validation(self):
+        self._pending_refresh &= ~_REFRESH_VALIDATE
+        if self._validate_source:
+            GLib.source_remove(self._validate_source)
+            self._validate_source = 0
+
+    def _validate_now(self):
+        """Run a pending debounced validation immediately."""
+        self._cancel_scheduled_validation()
+        self._validate_inputs()
+
+    def _on_validate_timeout(self):
+        self._validate_source = 0
+        self._validate_inputs()
+        return GLib.SOURCE_REMOVE
+
     def _validate_inputs(self, *_args):
-        name = self.app_page.name_row.get_text().strip()
-        exe = self.app_info.executable
+        name = self._app_name
 
         # Validate name with proper validator
         name_valid = False
         if name:
             try:
                 validate_app_name(name)
-                name_valid = True
-                self.app_page.name_row.remove_css_class("error")
             except ValidationError:
+                pass
+            else:
+                name_valid = True
+
+        # Touch the style classes only when the error state flips
+        name_error = bool(name) and not name_valid
+        if name_error != self._name_error_css:
+            self._name_error_css = name_error
+            if name_error:
                 self.app_page.name_row.add_css_class("error")
-        else:
-            self.app_page.name_row.remove_css_class("error")
+            else:
+                self.app_page.name_row.remove_css_class("error")
 
-        exe_valid = exe is not None and os.path.exists(exe)
+        exe_valid = self._executable_exists
         valid = name_valid and exe_valid
 
         self.app_page.continue_button.set_sensitive(valid)
         self.build_page.build_button.set_sensitive(valid)
 
-        row = self.app_page.status_row
-        group = self.app_page.status_group
-        icon = self.app_page._status_icon
         if valid:
-            group.set_visible(True)
-            row.set_title(_("Ready to Build"))
-            row.set_subtitle(_("All requirements met"))
-            icon.set_from_icon_name("emblem-ok-symbolic")
-            row.remove_css_class("warning")
-            row.add_css_class("success")
+            state = "ready"
         elif exe_valid and not name:
-            group.set_visible(True)
-            row.set_title(_("Almost Ready!"))
-            row.set_subtitle(_("Please enter an Application Name"))
-            icon.set_from_icon_name("dialog-warning-symbolic")
-            row.remove_css_class("success")
-            row.add_css_class("warning")
+            state = "missing-name"
         elif exe_valid and name and not name_valid:
-            group.set_visible(True)
-            row.set_title(_("Almost Ready!"))
-            row.set_subtitle(_("Application name contains invalid characters"))
-            icon.set_from_icon_name("dialog-warning-symbolic")
-            row.remove_css_class("success")
-            row.add_css_class("warning")
+            state = "invalid-name"
         elif name_valid and not exe_valid:
-            group.set_visible(True)
-            row.set_title(_("Select Executable"))
-            row.set_subtitle(_("Please choose the main executable file"))
-            icon.set_from_icon_name("dialog-warning-symbolic")
-            row.remove_css_class("success")
-            row.add_css_class("warning")
+            state = "missing-executable"
         else:
+            state = None
+
+        # Leave the status row alone (and untranslated) when it already
+        # shows this state
+        if state == self._status_state:
+            return
+        self._status_state = state
+
+        row = self.app_page.status_row
+        group = self.app_page.status_group
+        row.remove_css_class("success")
+        row.remove_css_class("warning")
+        if state is None:
             group.set_visible(False)
-            row.remove_css_class("success")
-            row.remove_css_class("warning")
+            return
+        title, subtitle, icon_name, css_class = self._status_content(state)
+        group.set_visible(True)
+        row.set_title(title)
+        row.set_subtitle(subtitle)
+        self.app_page._status_icon.set_from_icon_name(icon_name)
+        row.add_css_class(css_class)
+
+    @staticmethod
+    def _status_content(state: str) -> tuple[str, str, str, str]:
+        """Return (title, subtitle, icon name, style class) for a status"""
+        if state == "ready":
+            return (
+                _("Ready to Build"),
+                _("All requirements met"),
+                "emblem-ok-symbolic",
+                "success",
+            )
+        if state == "missing-name":
+            return (
+                _("Almost Ready!"),
+                _("Please enter an Application Name"),
+                "dialog-warning-symbolic",
+                "warning",
+            )
+        if state == "invalid-name":
+            return (
+                _("Almost Ready!"),
+                _("Application name contains invalid characters"),
+                "dialog-warning-symbolic",
+                "warning",
+            )
+        return (
+            _("Select Executable"),
+            _("Please choose the main executable file"),
+            "dialog-warning-symbolic",
+            "warning",
+        )
 
     def _validate_version_input(self, entry):
         """Validate version field inline on every keystroke."""
@@ -371,9 +563,10 @@ class AppImageCreatorWindow(Adw.ApplicationWindow):
             return
         try:
             validate_version(text)
-            entry.remove_css_class("error")
         except ValidationError:
             entry.add_css_class("error")
+        else:
+            entry.remove_css_class("error")
 
     def _validate_update_url_input(self, entry):
         """Validate update URL field inline on every keystroke."""
@@ -387,23 +580,41 @@ class AppImageCreatorWindow(Adw.ApplicationWindow):
             entry.add_css_class("error")
 
     def _on_name_changed(self, entry):
-        self.config_page.update_pattern_from_name(entry.get_text().strip())
+        """Remember the name, then validate and derive the update filename
+        pattern once typing pauses."""
+        self._app_name = entry.get_text().strip()
+        self._schedule_validate_inputs()
+        if self._name_pattern_source:
+            GLib.source_remove(self._name_pattern_source)
+        self._name_pattern_source = GLib.timeout_add(
+            VALIDATE_DELAY_MS, self._on_name_pattern_timeout
+        )
+
+    def _on_name_pattern_timeout(self):
+        self._name_pattern_source = 0
+        self.config_page.update_pattern_from_name(self._app_name)
+        return GLib.SOURCE_REMOVE
 
     # ------------------------------------------------------------------
     #  Dependency switches
     # ------------------------------------------------------------------
 
-    def _populate_dependency_switches(self):
-        from core.build_config import SYSTEM_DEPENDENCIES
+    def _ensure_dependency_switches(self):
+        """Create the dependency switches the first time they are needed."""
+        if not self._deps_populated:
+            self._deps_populated = True
+            self._populate_dependency_switches()
 
-        while child := self.build_page.deps_list_box.get_first_child():
-            self.build_page.deps_list_box.remove(child)
+    def _populate_dependency_switches(self):
+        clear_list_box(self.build_page.deps_list_box)
         self.dependency_switches.clear()
+        self._active_deps.clear()
 
         for key, data in SYSTEM_DEPENDENCIES.items():
             sw = Adw.SwitchRow()
             sw.set_title(data["name"])
             sw.dependency_key = key  # type: ignore[attr-defined]
+            sw.connect("notify::active", self._on_dependency_toggled)
             self.build_page.deps_list_box.append(sw)
             self.dependency_switches[key] = sw
 
@@ -415,16 +626,24 @@ class AppImageCreatorWindow(Adw.ApplicationWindow):
             self.build_page.deps_row.get_active()
         )
 
+    def _on_dependency_toggled(self, switch, _param):
+        if switch.get_active():
+            self._active_deps.add(switch.dependency_key)
+        else:
+            self._active_deps.discard(switch.dependency_key)
+
+    def _selected_dependencies(self) -> list[str]:
+        """Keys of the enabled dependency switches, in table order"""
+        return [k for k in self.dependency_switches if k in self._active_deps]
+
     def _update_autodetected_dependencies(self):
-        from core.build_config import SYSTEM_DEPENDENCIES
+        self._ensure_dependency_switches()
 
         for key, switch in self.dependency_switches.items():
             if not SYSTEM_DEPENDENCIES[key].get("essential", False):
                 switch.set_active(False)
 
-        gui_deps = self.builder._detect_gui_dependencies(self.app_info)
-        if self.builder._detect_gi_usage(self.app_info):
-            gui_deps["gi"] = True
+        gui_deps = self._detect_gui_dependencies()
 
         for dep_key, switch in self.dependency_switches.items():
             dep_info = SYSTEM_DEPENDENCIES[dep_key]
@@ -438,25 +657,39 @@ class AppImageCreatorWindow(Adw.ApplicationWindow):
                 switch.set_sensitive(True)
                 switch.set_subtitle("")
 
-        self.app_info.selected_dependencies = [
-            k for k, s in self.dependency_switches.items() if s.get_active()
-        ]
+        self.app_info.selected_dependencies = self._selected_dependencies()
+
+    def _detect_gui_dependencies(self) -> dict[str, bool]:
+        """Return the detected GUI frameworks (plus "gi") for the current
+        executable, reusing the last scan while the executable is unchanged."""
+        info = self.app_info
+        analysis = info.structure_analysis or {}
+        try:
+            mtime = os.stat(info.executable).st_mtime_ns
+        except OSError:
+            mtime = None
+        key = (
+            info.executable,
+            mtime,
+            analysis.get("type"),
+            analysis.get("project_root"),
+        )
+        gui_deps = self._gui_deps_cache.get(key)
+        if gui_deps is None:
+            gui_deps = self.builder._detect_gui_dependencies(info)
+            if self.builder._detect_gi_usage(info):
+                gui_deps["gi"] = True
+            self._gui_deps_cache[key] = gui_deps
+        return gui_deps
 
     # ------------------------------------------------------------------
     #  Environment management
     # ------------------------------------------------------------------
 
     def _refresh_system_status(self):
-        """Update welcome-page system status, environments, and connect install button."""
+        """Update welcome-page system status and environments."""
         self.welcome_page.update_system_status(self.env_manager)
         self.welcome_page.update_environments(self.env_manager)
-        btn = self.welcome_page.install_button
-        if btn and not getattr(btn, "_handler_connected", False):
-            btn.connect(
-                "clicked",
-                lambda _: self._on_install_packages_clicked(self.env_manager),
-            )
-            btn._handler_connected = True  # type: ignore[attr-defined]
 
     def _refresh_environments(self):
         """Refresh both system status and build-page environment lists."""
@@ -465,138 +698,98 @@ class AppImageCreatorWindow(Adw.ApplicationWindow):
         self.build_page.update_environments(self.env_manager)
 
     def _on_setup_environment_clicked(self, env_id: str):
-        env_spec = next((e for e in SUPPORTED_ENVIRONMENTS if e["id"] == env_id), None)
+        env_spec = SUPPORTED_ENVIRONMENTS_BY_ID.get(env_id)
         if not env_spec:
             return
 
-        dialog = Adw.Window()
-        dialog.set_transient_for(self)
-        dialog.set_modal(True)
-        dialog.set_default_size(450, 400)
-        dialog.set_resizable(False)
-
-        main_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
-        dialog.set_content(main_box)
-
-        content = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=16)
-        content.set_margin_top(24)
-        content.set_margin_bottom(24)
-        content.set_margin_start(24)
-        content.set_margin_end(24)
-        main_box.append(content)
-
-        title_label = Gtk.Label(label=_("Setup Build Environment?"))
-        title_label.add_css_class("title-2")
-        title_label.set_margin_bottom(8)
-        content.append(title_label)
-
-        info_label = Gtk.Label(
-            label=_(
-                "This will download and setup '{}'.\n\n"
-                "This process may take 5-15 minutes depending on your "
-                "internet connection.\n\nThe following will be installed:"
-            ).format(env_spec["name"])
-        )
-        info_label.set_wrap(True)
-        info_label.set_xalign(0)
-        info_label.set_justify(Gtk.Justification.LEFT)
-        content.append(info_label)
-
-        details_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
-        details_box.add_css_class("card")
-        details_box.set_margin_start(12)
-        details_box.set_margin_end(12)
-        details_box.set_margin_top(8)
-        details_box.set_margin_bottom(8)
-        content.append(details_box)
-
-        img_lbl = Gtk.Label(label=f"• Container image: {env_spec['image']}")
-        img_lbl.set_xalign(0)
-        img_lbl.set_margin_start(12)
-        img_lbl.set_margin_top(8)
-        details_box.append(img_lbl)
-
-        deps_lbl = Gtk.Label(
-            label=f"• Build dependencies: {len(env_spec['build_deps'])} packages"
+        if self._setup_dialog is None:
+            self._setup_dialog = self._create_setup_dialog()
+        self._setup_env_id = env_id
+        self._setup_dialog.set_body(
+            _SETUP_BODY.format(
+                env_spec["name"], env_spec["image"], len(env_spec["build_deps"])
+            )
         )
-        deps_lbl.set_xalign(0)
-        deps_lbl.set_margin_start(12)
-        deps_lbl.set_margin_bottom(8)
-        details_box.append(deps_lbl)
-
-        q_lbl = Gtk.Label(label=_("Do you want to continue?"))
-        q_lbl.set_xalign(0)
-        q_lbl.set_margin_top(8)
-        content.append(q_lbl)
-
-        btn_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        btn_box.set_halign(Gtk.Align.CENTER)
-        btn_box.set_margin_top(16)
-        content.append(btn_box)
-
-        cancel_btn = Gtk.Button(label=_("Cancel"))
-        cancel_btn.set_size_request(140, -1)
-        cancel_btn.connect("clicked", lambda _: dialog.close())
-        btn_box.append(cancel_btn)
-
-        setup_btn = Gtk.Button(label=_("Setup Environment"))
-        setup_btn.set_size_request(180, -1)
-        setup_btn.add_css_class("suggested-action")
-        btn_box.append(setup_btn)
+        self._setup_dialog.present()
+
+    def _create_setup_dialog(self) -> Adw.MessageDialog:
+        dialog = Adw.MessageDialog(transient_for=self, hide_on_close=True)
+        dialog.set_heading(_SETUP_HEADING)
+        dialog.add_response("cancel", _SETUP_CANCEL)
+        dialog.add_response("setup", _SETUP_CONFIRM)
+        dialog.set_response_appearance("setup", Adw.ResponseAppearance.SUGGESTED)
+        dialog.set_default_response("cancel")
+        dialog.connect("response", self._on_setup_response)
+        return dialog
 
-        def on_setup(_btn):
-            dialog.close()
+    def _on_setup_response(self, _dialog, response: str):
+        if response == "setup":
             progress = LogProgressDialog(self, _("Setting Up Environment"))
             progress.present()
-            threading.Thread(
-                target=self._run_environment_setup,
-                args=(env_id, progress),
-                daemon=True,
-            ).start()
+            self._submit_env_job(
+                self._run_environment_setup, self._setup_env_id, progress
+            )
 
-        setup_btn.connect("clicked", on_setup)
-        dialog.present()
+    def _submit_env_job(self, func, *args) -> None:
+        """Queue ``func(*args)`` for the environment worker thread."""
+        if self._env_worker is None:
+            self._env_worker = threading.Thread(
+                target=self._env_worker_loop, name="env-worker", daemon=True
+            )
+            self._env_worker.start()
+        self._env_jobs.put((func, args))
+
+    def _env_worker_loop(self) -> None:
+        while True:
+            func, args = self._env_jobs.get()
+            try:
+                func(*args)
+            except Exception as e:
+                # The jobs report their own errors; keep the worker alive
+                print(f"Environment job failed: {e}")
 
     def _run_environment_setup(self, env_id: str, dialog: LogProgressDialog):
-        def log(msg):
-            GLib.idle_add(dialog.add_log, msg)
+        log = dialog.queue_log
 
         def is_cancelled() -> bool:
             return dialog.cancelled
 
         try:
-            GLib.idle_add(dialog.set_status, _("Creating container..."))
+            GLib.idle_add(
+                dialog.set_status, _CREATING_CONTAINER, priority=GLib.PRIORITY_HIGH_IDLE
+            )
             self.env_manager.create_environment(
                 env_id, log_callback=log, cancel_check=is_cancelled
             )
 
             if dialog.cancelled:
-                GLib.idle_add(dialog.add_log, _("Setup cancelled by user."))
-                GLib.idle_add(dialog.finish, False)
+                log(_SETUP_CANCELLED)
+                GLib.idle_add(dialog.finish, False, priority=GLib.PRIORITY_HIGH_IDLE)
                 return
 
             GLib.idle_add(
                 dialog.set_status,
-                _("Installing dependencies (this may take a while)..."),
+                _INSTALLING_DEPENDENCIES,
+                priority=GLib.PRIORITY_HIGH_IDLE,
             )
             self.env_manager.setup_environment_dependencies(
                 env_id, log_callback=log, cancel_check=is_cancelled
             )
 
             if dialog.cancelled:
-                GLib.idle_add(dialog.add_log, _("Setup cancelled by user."))
-                GLib.idle_add(dialog.finish, False)
+                log(_SETUP_CANCELLED)
+                GLib.idle_add(dialog.finish, False, priority=GLib.PRIORITY_HIGH_IDLE)
                 return
 
-            GLib.idle_add(dialog.finish, True)
+            GLib.idle_add(dialog.finish, True, priority=GLib.PRIORITY_HIGH_IDLE)
         except Exception as e:
-            GLib.idle_add(dialog.add_log, _("Error: {}").format(e))
-            GLib.idle_add(dialog.finish, False)
+            log(_ERROR.format(e))
+            GLib.idle_add(dialog.finish, False, priority=GLib.PRIORITY_HIGH_IDLE)
         finally:
-            GLib.idle_add(self._refresh_environments)
+            GLib.idle_add(self._refresh_environments, priority=GLib.PRIORITY_LOW)
 
     def _on_remove_environment_clicked(self, env_id: str):
-        env_spec = next((e for e in SUPPORTED_ENVIRONMENTS if e["id"] == env_id), None)
+        env_spec = SUPPORTED_ENVIRONMENTS_BY_ID.get(env_id)
         if not env_spec:
             return
 
@@ -617,28 +810,25 @@ class AppImageCreatorWindow(Adw.ApplicationWindow):
             if resp == "remove":
                 progress = LogProgressDialog(self, _("Removing Environment"))
                 progress.present()
-                threading.Thread(
-                    target=self._run_environment_removal,
-                    args=(env_id, progress),
-                    daemon=True,
-                ).start()
+                self._submit_env_job(self._run_environment_removal, env_id, progress)
 
         dialog.connect("response", on_response)
         dialog.present()
 
     def _run_environment_removal(self, env_id: str, dialog: LogProgressDialog):
-        def log(msg):
-            GLib.idle_add(dialog.add_log, msg)
+        log = dialog.queue_log
 
         try:
-            GLib.idle_add(dialog.set_status, _("Removing container..."))
+            GLib.idle_add(
+                dialog.set_status, _REMOVING_CONTAINER, priority=GLib.PRIORITY_HIGH_IDLE
+            )
             self.env_manager.remove_environment(env_id, log_callback=log)
-            GLib.idle_add(dialog.finish, True)
+            GLib.idle_add(dialog.finish, True, priority=GLib.PRIORITY_HIGH_IDLE)
         except Exception as e:
-            GLib.idle_add(dialog.add_log, _("Error: {}").format(e))
-            GLib.idle_add(dialog.finish, False)
+            log(_ERROR.format(e))
+            GLib.idle_add(dialog.finish, False, priority=GLib.PRIORITY_HIGH_IDLE)
         finally:
-            GLib.idle_add(self._refresh_environments)
+            GLib.idle_add(self._refresh_environments, priority=GLib.PRIORITY_LOW)
 
     def _on_install_packages_clicked(self, env_manager):
         install_info = env_manager.get_install_command()
@@ -681,15 +871,11 @@ class AppImageCreatorWindow(Adw.ApplicationWindow):
     # ------------------------------------------------------------------
 
     def _on_choose_executable(self, _button):
-        filters = {
-            _("Executable Files"): ["*.py", "*.sh", "*.jar", "*"],
-            _("All Files"): ["*"],
-        }
         create_file_chooser(
             self,
-            _("Choose Executable"),
+            _CHOOSE_EXECUTABLE,
             Gtk.FileChooserAction.OPEN,
-            filters,
+            _EXECUTABLE_FILTERS,
             self._on_executable_selected,
             self.settings,
         )
@@ -700,16 +886,15 @@ class AppImageCreatorWindow(Adw.ApplicationWindow):
             if file:
                 path = file.get_path()
                 self.app_info.executable = path
+                self._executable_exists = os.path.exists(path)
                 filename = os.path.basename(path)
 
-                self.app_page.executable_row.set_subtitle(
-                    _("Selected: {}").format(filename)
-                )
+                self.app_page.executable_row.set_subtitle(_SELECTED.format(filename))
 
                 # Auto-fill name immediately (lightweight)
-                if not self.app_page.name_row.get_text().strip():
+                if not self._app_name:
                     suggested = os.path.splitext(filename)[0]
-                    suggested = suggested.replace("-gui", "").replace("-cli", "")
+                    suggested = suggested.removesuffix("-gui").removesuffix("-cli")
                     suggested = suggested.replace("_", " ").title()
                     if suggested and len(suggested) > 2:
                         self.app_page.name_row.set_text(suggested)
@@ -724,6 +909,10 @@ class AppImageCreatorWindow(Adw.ApplicationWindow):
                 self.app_page.status_row.remove_css_class("success")
                 self.app_page.status_row.remove_css_class("warning")
                 self.app_page.continue_button.set_sensitive(False)
+                # The name was just auto-filled; validate after the analysis
+                # rather than letting a pending run replace this status
+                self._cancel_scheduled_validation()
+                self._status_state = "analyzing"
 
                 # Run heavy analysis in background thread
                 def _analyze():
@@ -741,18 +930,9 @@ class AppImageCreatorWindow(Adw.ApplicationWindow):
         self.app_info.structure_analysis = structure
         self.app_info.app_type = app_type
 
-        type_map = {
-            "binary": 0,
-            "python": 1,
-            "python_wrapper": 2,
-            "shell": 3,
-            "java": 4,
-            "qt": 5,
-            "gtk": 6,
-            "electron": 7,
-        }
-        if app_type in type_map:
-            self.app_page.app_type_row.set_selected(type_map[app_type])
+        type_index = APP_TYPE_INDEX.get(app_type)
+        if type_index is not None:
+            self.app_page.app_type_row.set_selected(type_index)
             saved_libs = self.lib_profiles.load(app_type)
             if saved_libs:
                 self.build_page.set_extra_libs(saved_libs)
@@ -770,7 +950,7 @@ class AppImageCreatorWindow(Adw.ApplicationWindow):
             self.app_info.custom_desktop_file = desktop_files[0]
             self.app_info.use_existing_desktop = True
             self.app_page.desktop_row.set_subtitle(
-                _("Detected: {}").format(os.path.basename(desktop_files[0]))
+                _DETECTED.format(os.path.basename(desktop_files[0]))
             )
 
         # Auto-set detected icon (best candidate, not first found — symbolic
@@ -787,26 +967,19 @@ class AppImageCreatorWindow(Adw.ApplicationWindow):
             best_icon = select_best_icon(icons, hint)
             self.app_info.icon = best_icon
             self.app_page.icon_row.set_subtitle(
-                _("Detected: {}").format(os.path.basename(best_icon))
+                _DETECTED.format(os.path.basename(best_icon))
             )
 
-        # Update config-page sections
-        self._update_detected_files()
-        self._update_additional_directories_from_analysis()
-        self._update_desktop_file_options()
-        self._update_structure_preview()
-        self._update_autodetected_dependencies()
-
-        self._validate_inputs()
+        # Update config-page sections and revalidate in one batched pass
+        self._schedule_refresh(_REFRESH_ANALYSIS)
         return False  # Remove from idle
 
     def _on_choose_icon(self, _button):
-        filters = {_("Image Files"): ["*.png", "*.svg", "*.jpg", "*.ico"]}
         create_file_chooser(
             self,
-            _("Choose Icon"),
+            _CHOOSE_ICON,
             Gtk.FileChooserAction.OPEN,
-            filters,
+            _IMAGE_FILTERS,
             self._on_icon_selected,
             self.settings,
         )
@@ -818,17 +991,16 @@ class AppImageCreatorWindow(Adw.ApplicationWindow):
                 path = file.get_path()
                 self.app_info.icon = path
                 self.app_page.icon_row.set_subtitle(
-                    _("Selected: {}").format(os.path.basename(path))
+                    _SELECTED.format(os.path.basename(path))
                 )
         dialog.destroy()
 
     def _on_choose_desktop_app_page(self, _button):
-        filters = {_("Desktop Files"): ["*.desktop"]}
         create_file_chooser(
             self,
-            _("Choose Desktop File"),
+            _CHOOSE_DESKTOP_FILE,
             Gtk.FileChooserAction.OPEN,
-            filters,
+            _DESKTOP_FILTERS,
             self._on_desktop_app_page_selected,
             self.settings,
         )
@@ -841,12 +1013,12 @@ class AppImageCreatorWindow(Adw.ApplicationWindow):
                 self.app_info.custom_desktop_file = path
                 self.app_info.use_existing_desktop = True
                 self.app_page.desktop_row.set_subtitle(
-                    _("Selected: {}").format(os.path.basename(path))
+                    _SELECTED.format(os.path.basename(path))
                 )
                 # Also update config page
                 self.config_page.desktop_file_group.set_visible(True)
                 self.config_page.manual_desktop_row.set_subtitle(
-                    _("Selected: {}").format(os.path.basename(path))
+                    _SELECTED.format(os.path.basename(path))
                 )
                 self.config_page.use_existing_desktop_row.set_active(True)
         dialog.destroy()
@@ -854,7 +1026,7 @@ class AppImageCreatorWindow(Adw.ApplicationWindow):
     def _on_add_directory(self, _button):
         create_file_chooser(
             self,
-            _("Add Directory"),
+            _ADD_DIRECTORY,
             Gtk.FileChooserAction.SELECT_FOLDER,
             None,
             self._on_directory_selected,
@@ -866,13 +1038,13 @@ class AppImageCreatorWindow(Adw.ApplicationWindow):
             file = dialog.get_file()
             if file:
                 self.config_page.directory_list.add_directory(file.get_path())
-                self._update_structure_preview()
+                self._schedule_refresh(_REFRESH_PREVIEW)
         dialog.destroy()
 
     def _on_choose_output_dir(self, _button):
         create_file_chooser(
             self,
-            _("Choose Output Directory"),
+            _CHOOSE_OUTPUT_DIR,
             Gtk.FileChooserAction.SELECT_FOLDER,
             None,
             self._on_output_dir_selected,
@@ -892,13 +1064,40 @@ class AppImageCreatorWindow(Adw.ApplicationWindow):
     #  Detected-files / desktop / preview helpers
     # ------------------------------------------------------------------
 
+    def _schedule_refresh(self, flags: int) -> None:
+        """Queue _REFRESH_* steps; a single idle pass runs all queued steps."""
+        if not self._pending_refresh:
+            GLib.idle_add(self._flush_refresh)
+        self._pending_refresh |= flags
+
+    def _flush_refresh(self):
+        flags, self._pending_refresh = self._pending_refresh, 0
+        if flags & _REFRESH_DETECTED:
+            self._update_detected_files()
+        if flags & _REFRESH_DIRS:
+            self._update_additional_directories_from_analysis()
+        if flags & _REFRESH_DESKTOP:
+            self._update_desktop_file_options()
+        if flags & _REFRESH_PREVIEW:
+            self._update_structure_preview()
+        if flags & _REFRESH_DEPS:
+            self._update_autodetected_dependencies()
+        if flags & _REFRESH_VALIDATE:
+            self._validate_inputs()
+        return GLib.SOURCE_REMOVE
+
     def _update_detected_files(self):
         if not self.structure_analysis:
             self.config_page.detected_group.set_visible(False)
+            self._shown_detected = None
             return
         detected = self.structure_analysis.get("detected_files", {})
-        filtered = {k: v for k, v in detected.items() if k != "desktop_files"}
-        if any(filtered.values()):
+        # Same analysis result as last time: the group is already up to date
+        if detected is self._shown_detected:
+            return
+        self._shown_detected = detected
+        # Desktop files have their own section; only the rest count here
+        if any(v for k, v in detected.items() if k != "desktop_files"):
             self.config_page.detected_group.set_visible(True)
             self.config_page.detected_files.update(detected)
         else:
@@ -919,13 +1118,23 @@ class AppImageCreatorWindow(Adw.ApplicationWindow):
             "desktop_files", []
         )
         if desktop:
-            self.config_page.desktop_file_group.set_visible(True)
-            self.app_info.detected_desktop_file = desktop[0]
-            self.config_page.found_desktop_row.set_subtitle(
-                _("Found: {}").format(os.path.basename(desktop[0]))
-            )
-            self.config_page.use_existing_desktop_row.set_active(True)
-            self.app_info.use_existing_desktop = True
+            group = self.config_page.desktop_file_group
+            use_existing = self.config_page.use_existing_desktop_row
+            # Hold back notifications until the group is fully updated, so
+            # listeners see the new state once instead of step by step
+            group.freeze_notify()
+            use_existing.freeze_notify()
+            try:
+                group.set_visible(True)
+                self.app_info.detected_desktop_file = desktop[0]
+                self.config_page.found_desktop_row.set_subtitle(
+                    _("Found: {}").format(os.path.basename(desktop[0]))
+                )
+                use_existing.set_active(True)
+                self.app_info.use_existing_desktop = True
+            finally:
+                use_existing.thaw_notify()
+                group.thaw_notify()
         else:
             self.config_page.desktop_file_group.set_visible(False)
             self.app_info.use_existing_desktop = False
@@ -935,16 +1144,16 @@ class AppImageCreatorWindow(Adw.ApplicationWindow):
 
     def _on_view_desktop_file(self, _button):
         df = self.app_info.detected_desktop_file
-        if df and os.path.exists(df):
+        # The viewer opens the file itself and reports a missing one
+        if df:
             show_desktop_file_viewer(self, df)
 
     def _on_choose_desktop_file(self, _button):
-        filters = {_("Desktop Files"): ["*.desktop"]}
         create_file_chooser(
             self,
-            _("Choose Desktop File"),
+            _CHOOSE_DESKTOP_FILE,
             Gtk.FileChooserAction.OPEN,
-            filters,
+            _DESKTOP_FILTERS,
             self._on_desktop_file_selected,
             self.settings,
         )
@@ -956,7 +1165,7 @@ class AppImageCreatorWindow(Adw.ApplicationWindow):
                 path = file.get_path()
                 self.app_info.custom_desktop_file = path
                 self.config_page.manual_desktop_row.set_subtitle(
-                    _("Selected: {}").format(os.path.basename(path))
+                    _SELECTED.format(os.path.basename(path))
                 )
                 self.config_page.use_existing_desktop_row.set_active(False)
         dialog.destroy()
@@ -965,43 +1174,65 @@ class AppImageCreatorWindow(Adw.ApplicationWindow):
         self.config_page.preview_group.set_visible(bool(self.app_info.executable))
 
     def _get_current_app_type(self) -> str:
-        types = [
-            "binary",
-            "python",
-            "python_wrapper",
-            "shell",
-            "java",
-            "qt",
-            "gtk",
-            "electron",
-        ]
         sel = self.app_page.app_type_row.get_selected()
-        return types[sel] if sel < len(types) else "unknown"
+        return APP_TYPES[sel] if sel < len(APP_TYPES) else "unknown"
 
     def _on_view_full_structure(self, _button):
         if not self.app_info.executable:
             return
         from core.structure_formatter import generate_detailed_structure
 
-        content = generate_detailed_structure(
-            app_name_raw=self.app_page.name_row.get_text(),
-            executable=self.app_info.executable,
-            structure_analysis=self.structure_analysis,
-            directories=self.config_page.directory_list.get_directories(),
-            app_type=self._get_current_app_type(),
-        )
+        # Read the widgets here; the directory walk runs in a worker thread
+        kwargs = {
+            "app_name_raw": self._app_name,
+            "executable": self.app_info.executable,
+            "structure_analysis": self.structure_analysis,
+            "directories": self.config_page.directory_list.get_directories(),
+            "app_type": self._get_current_app_type(),
+        }
+        self.config_page.full_structure_button.set_sensitive(False)
+        spinner = self.config_page.structure_spinner
+        spinner.set_visible(True)
+        spinner.start()
+
+        def _generate():
+            content = error = None
+            try:
+                content = generate_detailed_structure(**kwargs)
+            except Exception as e:
+                error = e
+            finally:
+                # Always hand back to the main thread so the spinner stops
+                GLib.idle_add(self._on_full_structure_ready, content, error)
+
+        threading.Thread(target=_generate, daemon=True).start()
+
+    def _on_full_structure_ready(self, content: str | None, error: Exception | None):
+        """Show the generated structure (or the error) on the main thread."""
+        spinner = self.config_page.structure_spinner
+        spinner.stop()
+        spinner.set_visible(False)
+        self.config_page.full_structure_button.set_sensitive(True)
+        if content is None:
+            show_error_dialog(
+                self,
+                _("Error"),
+                _("Could not generate the AppImage structure: {}").format(error),
+            )
+            return False
         show_structure_viewer(
             self,
             _("AppImage Structure - Full View"),
             content,
         )
+        return False
 
     # ------------------------------------------------------------------
     #  Collect app info from wizard pages
     # ------------------------------------------------------------------
 
     def _collect_app_info(self):
-        self.app_info.name = self.app_page.name_row.get_text().strip()
+        self.app_info.name = self._app_name
         self.app_info.version = (
             self.config_page.version_row.get_text().strip() or "1.0.0"
         )
@@ -1017,21 +1248,13 @@ class AppImageCreatorWindow(Adw.ApplicationWindow):
         sel = self.config_page.category_row.get_selected()
         self.app_info.categories = [categories[sel]]
 
-        types = [
-            "binary",
-            "python",
-            "python_wrapper",
-            "shell",
-            "java",
-            "qt",
-            "gtk",
-            "electron",
-        ]
+        # One bounds check covers "nothing selected" (INVALID_LIST_POSITION)
         sel = self.app_page.app_type_row.get_selected()
-        self.app_info.app_type = types[sel]
+        if sel < len(APP_TYPES):
+            self.app_info.app_type = APP_TYPES[sel]
 
         self.app_info.terminal = self.config_page.terminal_row.get_active()
-        self.app_info.additional_directories = (
+        self.app_info.additional_directories = list(
             self.config_page.directory_list.get_directories()
         )
         self.app_info.structure_analysis = self.structure_analysis
@@ -1043,9 +1266,8 @@ class AppImageCreatorWindow(Adw.ApplicationWindow):
         )
 
         # Dependencies (read directly – widgets are always alive)
-        self.app_info.selected_dependencies = [
-            k for k, s in self.dependency_switches.items() if s.get_active()
-        ]
+        self._ensure_dependency_switches()
+        self.app_info.selected_dependencies = self._selected_dependencies()
 
         # Build settings
         self.app_info.include_dependencies = self.build_page.deps_row.get_active()
@@ -1077,7 +1299,10 @@ class AppImageCreatorWindow(Adw.ApplicationWindow):
     #  Build
     # ------------------------------------------------------------------
 
-    def _on_build_clicked(self, _button):
+    def _on_build_clicked(self, button):
+        self._validate_now()
+        if not button.get_sensitive():
+            return
         try:
             self.build_in_progress = True
             self._collect_app_info()
@@ -1213,9 +1438,15 @@ class AppImageCreatorWindow(Adw.ApplicationWindow):
             )
 
     def _on_build_progress(self, percentage, message):
-        GLib.idle_add(self._update_progress_ui, percentage, message)
-
-    def _update_progress_ui(self, percentage, message):
+        # Only the newest report matters; keep one idle update queued at most
+        self._build_progress = (percentage, message)
+        if not self._build_progress_pending:
+            self._build_progress_pending = True
+            GLib.idle_add(self._update_progress_ui)
+
+    def _update_progress_ui(self):
+        self._build_progress_pending = False
+        percentage, message = self._build_progress
         if not self.build_in_progress:
             return False
         if self.progress_dialog:
@@ -1223,12 +1454,27 @@ class AppImageCreatorWindow(Adw.ApplicationWindow):
         return False
 
     def _on_build_log(self, message):
-        print(f"Build: {message}")
+        # Called from the build thread for every line; batch the writes
+        self._build_log.append(message)
+        if not self._build_log_flush_pending:
+            self._build_log_flush_pending = True
+            GLib.idle_add(self._flush_build_log)
+
+    def _flush_build_log(self):
+        # Clear the flag first so a line appended while draining schedules
+        # another flush instead of being left behind
+        self._build_log_flush_pending = False
+        pending = self._build_log
+        lines = [pending.popleft() for _i in range(len(pending))]
+        if lines:
+            sys.stdout.write("".join(f"Build: {line}\n" for line in lines))
+            sys.stdout.flush()
+        return GLib.SOURCE_REMOVE
 
     def _on_cancel_build(self, _button):
         self.build_in_progress = False
-        if self.builder:
-            self.builder.cancel_build()
+        if self._builder:
+            self._builder.cancel_build()
         if self.progress_dialog:
             self.progress_dialog.destroy()
             self.progress_dialog = None
@@ -137,26 +137,38 @@ def scan_directory_structure(directory_path: str | os.PathLike) -> dict:
     structure = {"dirs": [], "files": [], "total_size": 0}
 
     try:
-        dir_path = Path(directory_path)
-        if not dir_path.exists():
+        root = os.fspath(directory_path)
+        if not os.path.exists(root):
             return structure
 
-        for item in dir_path.rglob("*"):
+        # os.scandir() hands back the entry type with the listing, so only
+        # regular files need a stat() call (for their size)
+        pending = [""]
+        while pending:
+            rel_dir = pending.pop()
             try:
-                rel_path = item.relative_to(dir_path)
-
-                if item.is_file():
-                    size = item.stat().st_size
-                    structure["files"].append({
-                        "path": str(rel_path),
-                        "size": size,
-                        "type": get_file_type(str(item)),
-                    })
-                    structure["total_size"] += size
-                elif item.is_dir():
-                    structure["dirs"].append(str(rel_path))
-            except (OSError, PermissionError):
+                entries = os.scandir(os.path.join(root, rel_dir))
+            except OSError:
                 continue
+            with entries:
+                for entry in entries:
+                    rel_path = os.path.join(rel_dir, entry.name)
+                    try:
+                        if entry.is_file():
+                            size = entry.stat().st_size
+                            structure["files"].append({
+                                "path": rel_path,
+                                "size": size,
+                                "type": get_file_type(entry.path),
+                            })
+                            structure["total_size"] += size
+                        elif entry.is_dir():
+                            structure["dirs"].append(rel_path)
+                            # Like rglob(), do not descend into symlinked dirs
+                            if not entry.is_symlink():
+                                pending.append(rel_path)
+                    except OSError:
+                        continue
 
     except Exception as e:
         structure["error"] = str(e)